@@ -4,143 +4,32 @@ Builder Agent - Creates and improves websites
 """
 
 import os
+import re
 import json
-import subprocess
-import shutil
-from typing import Dict, List, Optional
+import asyncio
+import string
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
 
-class BuilderAgent:
-    def __init__(self, project_path: str, config: Dict):
-        self.project_path = project_path
-        self.config = config
-        self.tech_stack = {
-            "frontend": "react",
-            "build_tool": "vite",
-            "styling": "tailwindcss",
-            "language": "typescript"
-        }
-    
-    def create_project_structure(self) -> Dict[str, any]:
-        """Create initial project structure"""
-        try:
-            # Create project directory
-            os.makedirs(self.project_path, exist_ok=True)
-            
-            # Create standard React + Vite structure
-            structure = {
-                "src": {
-                    "components": {},
-                    "sections": {},
-                    "utils": {},
-                    "hooks": {},
-                    "services": {},
-                    "types": {}
-                },
-                "public": {},
-                "config": {}
-            }
-            
-            self._create_directory_structure(structure)
-            
-            # Create package.json
-            self._create_package_json()
-            
-            # Create vite.config.ts
-            self._create_vite_config()
-            
-            # Create tsconfig.json
-            self._create_tsconfig()
-            
-            # Create tailwind.config.js
-            self._create_tailwind_config()
-            
-            # Create index.html
-            self._create_index_html()
-            
-            # Create main.tsx
-            self._create_main_tsx()
-            
-            # Create App.tsx
-            self._create_app_tsx()
-            
-            return {
-                "success": True,
-                "message": "Project structure created successfully",
-                "path": self.project_path
-            }
-        
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    def _create_directory_structure(self, structure: Dict, base_path: str = ""):
-        """Recursively create directory structure"""
-        for name, content in structure.items():
-            path = os.path.join(self.project_path, base_path, name)
-            os.makedirs(path, exist_ok=True)
-            
-            if isinstance(content, dict):
-                self._create_directory_structure(content, os.path.join(base_path, name))
-    
-    def _create_package_json(self):
-        """Create package.json with all dependencies"""
-        package_json = {
-            "name": self.config.get("project_name", "elite-built-app"),
-            "private": True,
-            "version": "1.0.0",
-            "type": "module",
-            "scripts": {
-                "dev": "vite",
-                "build": "tsc && vite build",
-                "preview": "vite preview",
-                "lint": "eslint . --ext ts,tsx"
-            },
-            "dependencies": {
-                "react": "^18.2.0",
-                "react-dom": "^18.2.0",
-                "react-router-dom": "^6.20.0",
-                "framer-motion": "^10.16.4",
-                "lucide-react": "^0.294.0",
-                "axios": "^1.6.0",
-                "zustand": "^4.4.7"
-            },
-            "devDependencies": {
-                "@types/react": "^18.2.43",
-                "@types/react-dom": "^18.2.17",
-                "@typescript-eslint/eslint-plugin": "^6.14.0",
-                "@typescript-eslint/parser": "^6.14.0",
-                "@vitejs/plugin-react": "^4.2.1",
-                "autoprefixer": "^10.4.16",
-                "eslint": "^8.55.0",
-                "eslint-plugin-react-hooks": "^4.6.0",
-                "eslint-plugin-react-refresh": "^0.4.5",
-                "postcss": "^8.4.32",
-                "tailwindcss": "^3.3.6",
-                "typescript": "^5.2.2",
-                "vite": "^5.0.8"
-            }
-        }
-        
-        # Add database dependencies if needed
-        if self.config.get("database_type") == "postgresql":
-            package_json["dependencies"]["pg"] = "^8.11.3"
-            package_json["dependencies"]["@types/pg"] = "^8.10.9"
-        elif self.config.get("database_type") == "mongodb":
-            package_json["dependencies"]["mongodb"] = "^6.3.0"
-        
-        # Add API client dependencies
-        if self.config.get("api_keys", {}).get("stripe"):
-            package_json["dependencies"]["@stripe/stripe-js"] = "^2.4.0"
-        
-        with open(os.path.join(self.project_path, "package.json"), 'w') as f:
-            json.dump(package_json, f, indent=2)
-    
-    def _create_vite_config(self):
-        """Create vite.config.ts"""
-        vite_config = '''import { defineConfig } from 'vite'
+from elite_builder.utils import NEW_PROCESS_GROUP, dump_json_indented, kill_process_group, reap
+
+# Leaf directories of the standard React + Vite structure
+_LEAF_DIRS = (
+    "src/components",
+    "src/sections",
+    "src/utils",
+    "src/hooks",
+    "src/services",
+    "src/types",
+    "public",
+    "config",
+)
+
+# Static scaffold templates, encoded once at import so each write is a plain copy
+_VITE_CONFIG_BYTES = b'''import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
 
 // https://vitejs.dev/config/
@@ -156,54 +45,41 @@ export default defineConfig({
   }
 })
 '''
-        with open(os.path.join(self.project_path, "vite.config.ts"), 'w') as f:
-            f.write(vite_config)
-    
-    def _create_tsconfig(self):
-        """Create tsconfig.json"""
-        tsconfig = {
-            "compilerOptions": {
-                "target": "ES2020",
-                "useDefineForClassFields": True,
-                "lib": ["ES2020", "DOM", "DOM.Iterable"],
-                "module": "ESNext",
-                "skipLibCheck": True,
-                "moduleResolution": "bundler",
-                "allowImportingTsExtensions": True,
-                "resolveJsonModule": True,
-                "isolatedModules": True,
-                "noEmit": True,
-                "jsx": "react-jsx",
-                "strict": True,
-                "noUnusedLocals": True,
-                "noUnusedParameters": True,
-                "noFallthroughCasesInSwitch": True
-            },
-            "include": ["src"],
-            "references": [{"path": "./tsconfig.node.json"}]
-        }
-        
-        with open(os.path.join(self.project_path, "tsconfig.json"), 'w') as f:
-            json.dump(tsconfig, f, indent=2)
-        
-        # Create tsconfig.node.json
-        tsconfig_node = {
-            "compilerOptions": {
-                "composite": True,
-                "skipLibCheck": True,
-                "module": "ESNext",
-                "moduleResolution": "bundler",
-                "allowSyntheticDefaultImports": True
-            },
-            "include": ["vite.config.ts"]
-        }
-        
-        with open(os.path.join(self.project_path, "tsconfig.node.json"), 'w') as f:
-            json.dump(tsconfig_node, f, indent=2)
-    
-    def _create_tailwind_config(self):
-        """Create tailwind.config.js"""
-        tailwind_config = '''/** @type {import('tailwindcss').Config} */
+
+_TSCONFIG_BYTES = json.dumps({
+    "compilerOptions": {
+        "target": "ES2020",
+        "useDefineForClassFields": True,
+        "lib": ["ES2020", "DOM", "DOM.Iterable"],
+        "module": "ESNext",
+        "skipLibCheck": True,
+        "moduleResolution": "bundler",
+        "allowImportingTsExtensions": True,
+        "resolveJsonModule": True,
+        "isolatedModules": True,
+        "noEmit": True,
+        "jsx": "react-jsx",
+        "strict": True,
+        "noUnusedLocals": True,
+        "noUnusedParameters": True,
+        "noFallthroughCasesInSwitch": True
+    },
+    "include": ["src"],
+    "references": [{"path": "./tsconfig.node.json"}]
+}, indent=2).encode()
+
+_TSCONFIG_NODE_BYTES = json.dumps({
+    "compilerOptions": {
+        "composite": True,
+        "skipLibCheck": True,
+        "module": "ESNext",
+        "moduleResolution": "bundler",
+        "allowSyntheticDefaultImports": True
+    },
+    "include": ["vite.config.ts"]
+}, indent=2).encode()
+
+_TAILWIND_CONFIG_BYTES = b'''/** @type {import('tailwindcss').Config} */
 export default {
   content: [
     "./index.html",
@@ -225,23 +101,16 @@ export default {
   plugins: [],
 }
 '''
-        with open(os.path.join(self.project_path, "tailwind.config.js"), 'w') as f:
-            f.write(tailwind_config)
-        
-        # Create postcss.config.js
-        postcss_config = '''export default {
+
+_POSTCSS_CONFIG_BYTES = b'''export default {
   plugins: {
     tailwindcss: {},
     autoprefixer: {},
   },
 }
 '''
-        with open(os.path.join(self.project_path, "postcss.config.js"), 'w') as f:
-            f.write(postcss_config)
-    
-    def _create_index_html(self):
-        """Create index.html"""
-        index_html = '''<!doctype html>
+
+_INDEX_HTML_BYTES = b'''<!doctype html>
 <html lang="en">
   <head>
     <meta charset="UTF-8" />
@@ -255,12 +124,8 @@ export default {
   </body>
 </html>
 '''
-        with open(os.path.join(self.project_path, "index.html"), 'w') as f:
-            f.write(index_html)
-    
-    def _create_main_tsx(self):
-        """Create main.tsx"""
-        main_tsx = '''import React from 'react'
+
+_MAIN_TSX_BYTES = b'''import React from 'react'
 import ReactDOM from 'react-dom/client'
 import App from './App.tsx'
 import './index.css'
@@ -271,11 +136,8 @@ ReactDOM.createRoot(document.getElementById('root')!).render(
   </React.StrictMode>,
 )
 '''
-        with open(os.path.join(self.project_path, "src", "main.tsx"), 'w') as f:
-            f.write(main_tsx)
-        
-        # Create index.css
-        index_css = '''@tailwind base;
+
+_INDEX_CSS_BYTES = b'''@tailwind base;
 @tailwind components;
 @tailwind utilities;
 
@@ -290,12 +152,8 @@ body {
   min-height: 100vh;
 }
 '''
-        with open(os.path.join(self.project_path, "src", "index.css"), 'w') as f:
-            f.write(index_css)
-    
-    def _create_app_tsx(self):
-        """Create basic App.tsx"""
-        app_tsx = '''import { useState } from 'react'
+
+_APP_TSX_BYTES = b'''import { useState } from 'react'
 
 function App() {
   return (
@@ -314,56 +172,8 @@ function App() {
 
 export default App
 '''
-        with open(os.path.join(self.project_path, "src", "App.tsx"), 'w') as f:
-            f.write(app_tsx)
-    
-    def implement_features(self, features: List[str], feedback: Optional[str] = None) -> Dict:
-        """Implement requested features based on project spec and feedback"""
-        try:
-            # This would use AI/LLM to generate code, but for now we'll create structured components
-            implemented = []
-            
-            for feature in features:
-                result = self._implement_feature(feature, feedback)
-                if result["success"]:
-                    implemented.append(feature)
-            
-            return {
-                "success": True,
-                "implemented_features": implemented,
-                "message": f"Implemented {len(implemented)} features"
-            }
-        
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
-    
-    def _implement_feature(self, feature: str, feedback: Optional[str] = None) -> Dict:
-        """Implement a single feature"""
-        # This is a placeholder - in a real implementation, this would use an LLM
-        # to generate appropriate code based on the feature description
-        
-        feature_lower = feature.lower()
-        
-        if "navigation" in feature_lower or "navbar" in feature_lower:
-            return self._create_navigation_component()
-        elif "hero" in feature_lower:
-            return self._create_hero_section()
-        elif "api" in feature_lower or "backend" in feature_lower:
-            return self._create_api_service()
-        elif "database" in feature_lower:
-            return self._create_database_config()
-        elif "authentication" in feature_lower or "auth" in feature_lower:
-            return self._create_auth_system()
-        else:
-            # Generic component creation
-            return self._create_generic_component(feature)
-    
-    def _create_navigation_component(self) -> Dict:
-        """Create navigation component"""
-        nav_code = '''import { useState } from 'react'
+
+_NAVIGATION_BYTES = b'''import { useState } from 'react'
 import { Menu, X } from 'lucide-react'
 
 export default function Navigation() {
@@ -389,15 +199,8 @@ export default function Navigation() {
   )
 }
 '''
-        nav_path = os.path.join(self.project_path, "src", "components", "Navigation.tsx")
-        with open(nav_path, 'w') as f:
-            f.write(nav_code)
-        
-        return {"success": True, "component": "Navigation"}
-    
-    def _create_hero_section(self) -> Dict:
-        """Create hero section"""
-        hero_code = '''export default function Hero() {
+
+_HERO_BYTES = b'''export default function Hero() {
   return (
     <section className="bg-gradient-to-r from-primary-600 to-indigo-600 text-white py-20">
       <div className="container mx-auto px-4 text-center">
@@ -411,15 +214,8 @@ export default function Navigation() {
   )
 }
 '''
-        hero_path = os.path.join(self.project_path, "src", "sections", "Hero.tsx")
-        with open(hero_path, 'w') as f:
-            f.write(hero_code)
-        
-        return {"success": True, "component": "Hero"}
-    
-    def _create_api_service(self) -> Dict:
-        """Create API service"""
-        api_code = '''import axios from 'axios'
+
+_API_SERVICE_BYTES = b'''import axios from 'axios'
 
 const api = axios.create({
   baseURL: import.meta.env.VITE_API_URL || 'http://localhost:3001/api',
@@ -430,45 +226,8 @@ const api = axios.create({
 
 export default api
 '''
-        api_path = os.path.join(self.project_path, "src", "services", "api.ts")
-        with open(api_path, 'w') as f:
-            f.write(api_code)
-        
-        return {"success": True, "service": "api"}
-    
-    def _create_database_config(self) -> Dict:
-        """Create database configuration"""
-        db_type = self.config.get("database_type", "postgresql")
-        
-        if db_type == "postgresql":
-            db_code = f'''import pg from 'pg'
-
-const pool = new pg.Pool({{
-  connectionString: process.env.DATABASE_URL || '{self.config.get("database_url", "")}',
-  ssl: {str(self.config.get("database_ssl", False)).lower()}
-}})
-
-export default pool
-'''
-        else:
-            db_code = f'''import {{ MongoClient }} from 'mongodb'
 
-const client = new MongoClient(
-  process.env.MONGODB_URI || '{self.config.get("database_url", "")}'
-)
-
-export default client
-'''
-        
-        db_path = os.path.join(self.project_path, "src", "services", "database.ts")
-        with open(db_path, 'w') as f:
-            f.write(db_code)
-        
-        return {"success": True, "config": "database"}
-    
-    def _create_auth_system(self) -> Dict:
-        """Create authentication system"""
-        auth_code = '''import { create } from 'zustand'
+_AUTH_STORE_BYTES = b'''import { create } from 'zustand'
 
 interface AuthState {
   user: any | null
@@ -499,42 +258,347 @@ export const useAuth = create<AuthState>((set, get) => ({
   },
 }))
 '''
-        auth_path = os.path.join(self.project_path, "src", "hooks", "useAuth.ts")
-        with open(auth_path, 'w') as f:
-            f.write(auth_code)
+
+# Static scaffold files written by create_project_structure, relative to the project root
+_SCAFFOLD_FILES = (
+    ("vite.config.ts", _VITE_CONFIG_BYTES),
+    ("tsconfig.json", _TSCONFIG_BYTES),
+    ("tsconfig.node.json", _TSCONFIG_NODE_BYTES),
+    ("tailwind.config.js", _TAILWIND_CONFIG_BYTES),
+    ("postcss.config.js", _POSTCSS_CONFIG_BYTES),
+    ("index.html", _INDEX_HTML_BYTES),
+    ("src/main.tsx", _MAIN_TSX_BYTES),
+    ("src/index.css", _INDEX_CSS_BYTES),
+    ("src/App.tsx", _APP_TSX_BYTES),
+)
+
+# package.json serialized once; per-project fields are patched into these bytes
+_BASE_PACKAGE_JSON_BYTES = json.dumps({
+    "name": "elite-built-app",
+    "private": True,
+    "version": "1.0.0",
+    "type": "module",
+    "scripts": {
+        "dev": "vite",
+        "build": "tsc && vite build",
+        "preview": "vite preview",
+        "lint": "eslint . --ext ts,tsx"
+    },
+    "dependencies": {
+        "react": "^18.2.0",
+        "react-dom": "^18.2.0",
+        "react-router-dom": "^6.20.0",
+        "framer-motion": "^10.16.4",
+        "lucide-react": "^0.294.0",
+        "axios": "^1.6.0",
+        "zustand": "^4.4.7"
+    },
+    "devDependencies": {
+        "@types/react": "^18.2.43",
+        "@types/react-dom": "^18.2.17",
+        "@typescript-eslint/eslint-plugin": "^6.14.0",
+        "@typescript-eslint/parser": "^6.14.0",
+        "@vitejs/plugin-react": "^4.2.1",
+        "autoprefixer": "^10.4.16",
+        "eslint": "^8.55.0",
+        "eslint-plugin-react-hooks": "^4.6.0",
+        "eslint-plugin-react-refresh": "^0.4.5",
+        "postcss": "^8.4.32",
+        "tailwindcss": "^3.3.6",
+        "typescript": "^5.2.2",
+        "vite": "^5.0.8"
+    }
+}, indent=2).encode()
+_BASE_PACKAGE_NAME_FIELD = b'"name": "elite-built-app"'
+
+# (config predicate, dependencies) pairs appended to package.json in this order
+_OPTIONAL_DEPENDENCIES = (
+    (lambda config: config.get("database_type") == "postgresql",
+     {"pg": "^8.11.3", "@types/pg": "^8.10.9"}),
+    (lambda config: config.get("database_type") == "mongodb",
+     {"mongodb": "^6.3.0"}),
+    (lambda config: config.get("api_keys", {}).get("stripe"),
+     {"@stripe/stripe-js": "^2.4.0"}),
+)
+
+# O_BINARY only exists (and matters) on Windows, where it disables newline translation
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+def _write_file(path: Path, content: bytes):
+    """Write a small file with raw os calls, skipping the buffered file object"""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+async def _run_command(args: Tuple[str, ...], cwd: str, timeout: float, capture_stdout: bool = True) -> Tuple[int, Optional[str], str]:
+    """Run a command without blocking the event loop, returning (returncode, stdout, stderr)"""
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=NEW_PROCESS_GROUP
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except BaseException:
+        # Timed out or cancelled; do not leave npm or the scripts it started running in the background
+        kill_process_group(proc)
+        await reap(proc)
+        raise
+    return (
+        proc.returncode,
+        stdout.decode(errors="replace") if stdout is not None else None,
+        stderr.decode(errors="replace")
+    )
+
+# Scaffold writes are tiny and independent; a small pool is enough to overlap them
+_SCAFFOLD_WORKERS = 8
+
+# Database configs only vary by connection settings; formatted per call
+_POSTGRES_CONFIG_TEMPLATE = '''import pg from 'pg'
+
+const pool = new pg.Pool({{
+  connectionString: process.env.DATABASE_URL || '{database_url}',
+  ssl: {database_ssl}
+}})
+
+export default pool
+'''
+
+_MONGODB_CONFIG_TEMPLATE = '''import {{ MongoClient }} from 'mongodb'
+
+const client = new MongoClient(
+  process.env.MONGODB_URI || '{database_url}'
+)
+
+export default client
+'''
+
+# Feature keyword -> BuilderAgent handler, checked in order against the lowercased feature
+_FEATURE_HANDLERS = (
+    ("navigation", "_create_navigation_component"),
+    ("navbar", "_create_navigation_component"),
+    ("hero", "_create_hero_section"),
+    ("api", "_create_api_service"),
+    ("backend", "_create_api_service"),
+    ("database", "_create_database_config"),
+    ("authentication", "_create_auth_system"),
+    ("auth", "_create_auth_system"),
+)
+
+@functools.lru_cache(maxsize=256)
+def _feature_handler_name(feature: str) -> Optional[str]:
+    """Resolve the handler for a feature, or None for a generic component"""
+    feature_lower = feature.lower()
+    for keyword, handler_name in _FEATURE_HANDLERS:
+        if keyword in feature_lower:
+            return handler_name
+    return None
+
+# Generic component source; only the name and title are substituted per feature
+_COMPONENT_NAME_STRIP_RE = re.compile(r'[ -]+')
+_GENERIC_COMPONENT_TEMPLATE = string.Template('''export default function $name() {
+  return (
+    <div className="p-4">
+      <h2 className="text-2xl font-bold mb-4">$title</h2>
+      <p>This component implements: $title</p>
+    </div>
+  )
+}
+''')
+
+@functools.lru_cache(maxsize=256)
+def _render_generic_component(feature: str) -> Tuple[str, bytes]:
+    """Render the component name and source for a generic feature"""
+    component_name = _COMPONENT_NAME_STRIP_RE.sub("", feature)
+    component_code = _GENERIC_COMPONENT_TEMPLATE.substitute(name=component_name, title=feature)
+    return component_name, component_code.encode()
+
+class BuilderAgent:
+    # Fixed for every project; shared read-only instead of rebuilt per instance
+    _TECH_STACK = MappingProxyType({
+        "frontend": "react",
+        "build_tool": "vite",
+        "styling": "tailwindcss",
+        "language": "typescript"
+    })
+    
+    def __init__(self, project_path: str, config: Dict):
+        self.project_path = project_path
+        self.config = config
+        
+        # Output locations resolved once instead of joined on every write
+        self._root = Path(project_path)
+        self._src = self._root / "src"
+        self._components = self._src / "components"
+        self._sections = self._src / "sections"
+        self._services = self._src / "services"
+        self._hooks = self._src / "hooks"
+        
+        self.tech_stack = self._TECH_STACK
+    
+    def create_project_structure(self) -> Dict[str, any]:
+        """Create initial project structure"""
+        try:
+            # Create project directory
+            os.makedirs(self.project_path, exist_ok=True)
+            
+            # Create standard React + Vite structure
+            self._create_directory_structure()
+            
+            # Every scaffold file is independent, so overlap the writes
+            with ThreadPoolExecutor(max_workers=_SCAFFOLD_WORKERS) as executor:
+                # Create package.json (the only scaffold file that depends on config)
+                package_json = executor.submit(self._create_package_json)
+                
+                # Create vite/tsconfig/tailwind configs, index.html, main.tsx and App.tsx
+                list(executor.map(self._write_scaffold_file, _SCAFFOLD_FILES))
+                package_json.result()
+            
+            return {
+                "success": True,
+                "message": "Project structure created successfully",
+                "path": self.project_path
+            }
+        
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    def _create_directory_structure(self):
+        """Create the leaf directories; makedirs builds their parents"""
+        for leaf_dir in _LEAF_DIRS:
+            os.makedirs(self._root / leaf_dir, exist_ok=True)
+    
+    def _create_package_json(self):
+        """Create package.json with all dependencies"""
+        project_name = self.config.get("project_name", "elite-built-app")
+        extra_dependencies = {}
+        
+        # Add database and API client dependencies if needed
+        for applies, dependencies in _OPTIONAL_DEPENDENCIES:
+            if applies(self.config):
+                extra_dependencies.update(dependencies)
+        
+        if extra_dependencies:
+            # Rare path: re-serialize with the extra dependencies appended
+            package_json = json.loads(_BASE_PACKAGE_JSON_BYTES)
+            package_json["name"] = project_name
+            package_json["dependencies"].update(extra_dependencies)
+            content = dump_json_indented(package_json)
+        else:
+            # Common path: only the project name differs from the cached base
+            content = _BASE_PACKAGE_JSON_BYTES.replace(
+                _BASE_PACKAGE_NAME_FIELD,
+                b'"name": ' + json.dumps(project_name).encode(),
+                1
+            )
+        
+        _write_file(self._root / "package.json", content)
+    
+    def _write_scaffold_file(self, entry: Tuple[str, bytes]):
+        """Write one static scaffold file from _SCAFFOLD_FILES"""
+        relative_path, content = entry
+        _write_file(self._root / relative_path, content)
+    
+    def implement_features(self, features: List[str], feedback: Optional[str] = None) -> Dict:
+        """Implement requested features based on project spec and feedback"""
+        try:
+            # This would use AI/LLM to generate code, but for now we'll create structured components
+            implemented = []
+            
+            for feature in features:
+                result = self._implement_feature(feature, feedback)
+                if result["success"]:
+                    implemented.append(feature)
+            
+            return {
+                "success": True,
+                "implemented_features": implemented,
+                "message": f"Implemented {len(implemented)} features"
+            }
+        
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    def _implement_feature(self, feature: str, feedback: Optional[str] = None) -> Dict:
+        """Implement a single feature"""
+        # This is a placeholder - in a real implementation, this would use an LLM
+        # to generate appropriate code based on the feature description
+        
+        handler_name = _feature_handler_name(feature)
+        if handler_name is None:
+            # Generic component creation
+            return self._create_generic_component(feature)
+        
+        return getattr(self, handler_name)()
+    
+    def _create_navigation_component(self) -> Dict:
+        """Create navigation component"""
+        _write_file(self._components / "Navigation.tsx", _NAVIGATION_BYTES)
+        
+        return {"success": True, "component": "Navigation"}
+    
+    def _create_hero_section(self) -> Dict:
+        """Create hero section"""
+        _write_file(self._sections / "Hero.tsx", _HERO_BYTES)
+        
+        return {"success": True, "component": "Hero"}
+    
+    def _create_api_service(self) -> Dict:
+        """Create API service"""
+        _write_file(self._services / "api.ts", _API_SERVICE_BYTES)
+        
+        return {"success": True, "service": "api"}
+    
+    def _create_database_config(self) -> Dict:
+        """Create database configuration"""
+        db_type = self.config.get("database_type", "postgresql")
+        
+        if db_type == "postgresql":
+            db_code = _POSTGRES_CONFIG_TEMPLATE.format(
+                database_url=self.config.get("database_url", ""),
+                database_ssl=str(self.config.get("database_ssl", False)).lower()
+            )
+        else:
+            db_code = _MONGODB_CONFIG_TEMPLATE.format(
+                database_url=self.config.get("database_url", "")
+            )
+        
+        _write_file(self._services / "database.ts", db_code.encode())
+        
+        return {"success": True, "config": "database"}
+    
+    def _create_auth_system(self) -> Dict:
+        """Create authentication system"""
+        _write_file(self._hooks / "useAuth.ts", _AUTH_STORE_BYTES)
         
         return {"success": True, "system": "authentication"}
     
     def _create_generic_component(self, feature: str) -> Dict:
         """Create a generic component for unspecified features"""
-        component_name = feature.replace(" ", "").replace("-", "")
-        component_code = f'''export default function {component_name}() {{
-  return (
-    <div className="p-4">
-      <h2 className="text-2xl font-bold mb-4">{feature}</h2>
-      <p>This component implements: {feature}</p>
-    </div>
-  )
-}}
-'''
-        component_path = os.path.join(self.project_path, "src", "components", f"{component_name}.tsx")
-        with open(component_path, 'w') as f:
-            f.write(component_code)
+        component_name, component_code = _render_generic_component(feature)
+        _write_file(self._components / f"{component_name}.tsx", component_code)
         
         return {"success": True, "component": component_name}
     
-    def install_dependencies(self) -> Dict:
+    async def install_dependencies(self) -> Dict:
         """Install npm dependencies"""
         try:
-            result = subprocess.run(
-                ["npm", "install"],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
+            # npm progress output is discarded on success; only stderr is reported
+            returncode, _, stderr = await _run_command(("npm", "install"), self.project_path, 300, capture_stdout=False)
             
-            if result.returncode == 0:
+            if returncode == 0:
                 return {
                     "success": True,
                     "message": "Dependencies installed successfully"
@@ -542,10 +606,10 @@ export const useAuth = create<AuthState>((set, get) => ({
             else:
                 return {
                     "success": False,
-                    "error": result.stderr
+                    "error": stderr
                 }
         
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             return {
                 "success": False,
                 "error": "Installation timed out"
@@ -556,18 +620,12 @@ export const useAuth = create<AuthState>((set, get) => ({
                 "error": str(e)
             }
     
-    def build_project(self) -> Dict:
+    async def build_project(self) -> Dict:
         """Build the project"""
         try:
-            result = subprocess.run(
-                ["npm", "run", "build"],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
+            returncode, stdout, stderr = await _run_command(("npm", "run", "build"), self.project_path, 300)
             
-            if result.returncode == 0:
+            if returncode == 0:
                 return {
                     "success": True,
                     "message": "Project built successfully",
@@ -576,10 +634,15 @@ export const useAuth = create<AuthState>((set, get) => ({
             else:
                 return {
                     "success": False,
-                    "error": result.stderr,
-                    "stdout": result.stdout
+                    "error": stderr,
+                    "stdout": stdout
                 }
         
+        except asyncio.TimeoutError:
+            return {
+                "success": False,
+                "error": "Command '['npm', 'run', 'build']' timed out after 300 seconds"
+            }
         except Exception as e:
             return {
                 "success": False,
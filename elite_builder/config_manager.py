@@ -4,10 +4,21 @@ Configuration Manager - Handles API keys, database credentials, etc.
 """
 
 import os
-import json
-from typing import Dict, Optional
+import copy
+from contextlib import contextmanager
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+from elite_builder.utils import dump_json_indented, load_json
+
+# Services whose credential is an entry in config["api_keys"]
+_API_KEY_SERVICES = frozenset({"openai", "stripe", "github"})
 
 class ConfigManager:
+    # Parsed config files shared by all instances: path -> (mtime_ns, parsed content)
+    _file_cache: Dict[str, Tuple[int, Dict]] = {}
+    
     def __init__(self, config_path: Optional[str] = None):
         if config_path is None:
             base_dir = os.path.dirname(__file__)
@@ -15,6 +26,11 @@ class ConfigManager:
         
         self.config_path = config_path
         self.config = self._load_config()
+        self._view = MappingProxyType(self.config)
+        
+        # Saves requested inside batch() are deferred until the outermost batch exits
+        self._batch_depth = 0
+        self._dirty = False
     
     def _load_config(self) -> Dict:
         """Load configuration from file or environment"""
@@ -27,14 +43,13 @@ class ConfigManager:
             "services": {}
         }
         
-        # Load from file if exists
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, 'r') as f:
-                    file_config = json.load(f)
-                    config.update(file_config)
-            except Exception as e:
-                print(f"Warning: Could not load config file: {e}")
+        # Load from file if exists (a missing file surfaces from the stat, no separate check)
+        try:
+            config.update(self._read_config_file())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Warning: Could not load config file: {e}")
         
         # Override with environment variables
         config["database_url"] = os.getenv("DATABASE_URL", config.get("database_url"))
@@ -49,21 +64,56 @@ class ConfigManager:
         
         return config
     
-    def get_config(self) -> Dict:
-        """Get current configuration"""
-        return self.config.copy()
+    def _read_config_file(self) -> Dict:
+        """Read the config file, reusing the parsed content while its mtime is unchanged"""
+        mtime_ns = os.stat(self.config_path).st_mtime_ns
+        cached = ConfigManager._file_cache.get(self.config_path)
+        if cached is None or cached[0] != mtime_ns:
+            raw = Path(self.config_path).read_bytes()
+            cached = (mtime_ns, load_json(raw))
+            ConfigManager._file_cache[self.config_path] = cached
+        
+        # Callers mutate nested dicts (api_keys), so never hand out the cached copy
+        return copy.deepcopy(cached[1])
+    
+    def get_config(self) -> Mapping:
+        """Get a read-only view of the current configuration"""
+        return self._view
+    
+    def snapshot(self) -> Dict:
+        """Get an independent, mutable copy of the current configuration"""
+        return copy.deepcopy(self.config)
     
     def update_config(self, updates: Dict):
         """Update configuration"""
         self.config.update(updates)
         self._save_config()
     
+    @contextmanager
+    def batch(self) -> Iterator["ConfigManager"]:
+        """Group several updates into a single config file write"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._dirty = False
+                self._save_config()
+    
     def _save_config(self):
         """Save configuration to file"""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        
         try:
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            Path(self.config_path).write_bytes(dump_json_indented(self.config))
+            ConfigManager._file_cache[self.config_path] = (
+                os.stat(self.config_path).st_mtime_ns,
+                copy.deepcopy(self.config)
+            )
         except Exception as e:
             print(f"Warning: Could not save config file: {e}")
     
@@ -71,24 +121,22 @@ class ConfigManager:
         """Request credentials for required services"""
         missing = []
         available = []
+        api_keys = self.config.get("api_keys") or {}
+        configured_services = self.config.get("services") or {}
         
         for service in services:
             if service == "database":
-                if not self.config.get("database_url"):
-                    missing.append("database")
-                else:
-                    available.append("database")
-            elif service in ["openai", "stripe", "github"]:
-                if not self.config.get("api_keys", {}).get(service):
-                    missing.append(service)
-                else:
-                    available.append(service)
+                configured = bool(self.config.get("database_url"))
+            elif service in _API_KEY_SERVICES:
+                configured = bool(api_keys.get(service))
             else:
                 # Check if service is in config
-                if service not in self.config.get("services", {}):
-                    missing.append(service)
-                else:
-                    available.append(service)
+                configured = service in configured_services
+            
+            if configured:
+                available.append(service)
+            else:
+                missing.append(service)
         
         return {
             "available": available,
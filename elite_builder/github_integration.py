@@ -5,35 +5,140 @@ GitHub Integration - Exports projects to GitHub using MCP or direct API
 
 import os
 import json
-import subprocess
-import base64
-from typing import Optional, Dict
+import time
+import asyncio
+import mmap
+import shutil
+import hashlib
+import importlib.util
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple, Optional, Dict, FrozenSet, Iterator, Tuple
 from pathlib import Path
 
-try:
+if TYPE_CHECKING:
     from github import Github
-    GITHUB_PY_AVAILABLE = True
-except ImportError:
-    GITHUB_PY_AVAILABLE = False
+
+# PyGithub is only imported when a client is actually built, keeping it off the MCP startup path
+GITHUB_PY_AVAILABLE = importlib.util.find_spec("github") is not None
+
+# In-flight blob uploads; enough to hide request latency without tripping GitHub's abuse limits
+_MAX_CONCURRENT_UPLOADS = 16
+
+# Files above this size are mmapped for upload instead of read into a private bytes copy
+_MMAP_THRESHOLD = 64 * 1024
+
+def _git_blob_sha(content) -> str:
+    """Compute the sha git assigns to content as a blob, without uploading it"""
+    digest = hashlib.sha1(b"blob %d\0" % len(content))
+    digest.update(content)
+    return digest.hexdigest()
+
+# Default .gitignore for exported projects that do not ship their own
+_GITIGNORE_BYTES = (
+    b"node_modules/\n"
+    b"dist/\n"
+    b"build/\n"
+    b".env\n"
+    b".env.local\n"
+    b"*.log\n"
+    b".DS_Store\n"
+    b".vscode/\n"
+    b".idea/\n"
+    b".review_cache/\n"
+)
+
+# Never exported: git's own metadata and the reviewer's local cache of past reviews
+_EXPORT_SKIP_DIRS = frozenset({".git", ".review_cache"})
+
+# Directories the default .gitignore excludes; archive snapshots leave them out too
+_IGNORED_DIRS = frozenset(
+    line[:-1].decode() for line in _GITIGNORE_BYTES.splitlines() if line.endswith(b"/")
+)
+
+# Archives are built in memory; a larger snapshot falls back to the per-file API export
+_ARCHIVE_MAX_BYTES = 100 * 1024 * 1024
+
+# Resolved once; exec'ing the absolute path also skips the PATH search on every git call
+_GIT_PATH = shutil.which("git")
+
+class _GitResult(NamedTuple):
+    returncode: int
+    stdout: str
+    stderr: str
+
+async def _git(project_path: Optional[str], *args: str) -> _GitResult:
+    """Run a git command without blocking the event loop"""
+    # Let git resolve the work tree via -C rather than chdir-ing the child process
+    location = ("-C", project_path) if project_path else ()
+    proc = await asyncio.create_subprocess_exec(
+        _GIT_PATH, *location, *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    return _GitResult(proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace"))
+
+async def _exclude_from_git(project_path: str, pattern: bytes):
+    """Add pattern to the repo's .git/info/exclude, which keeps it out of `git add .` without touching .gitignore"""
+    result = await _git(project_path, "rev-parse", "--git-path", "info/exclude")
+    if result.returncode != 0:
+        return
+    # --git-path answers relative to the work tree unless the git dir lives elsewhere
+    exclude_path = os.path.join(project_path, result.stdout.strip())
+    try:
+        with open(exclude_path, "rb") as f:
+            if pattern in f.read().splitlines():
+                return
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(exclude_path), exist_ok=True)
+    with open(exclude_path, "ab") as f:
+        f.write(b"\n" + pattern + b"\n")
+
+def _iter_project_files(project_path: str, skip_dirs: FrozenSet[str] = frozenset()) -> Iterator[os.DirEntry]:
+    """Yield every file under project_path except those in _EXPORT_SKIP_DIRS or any directory named in skip_dirs"""
+    stack = [project_path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _EXPORT_SKIP_DIRS and entry.name not in skip_dirs:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
 
 class GitHubExporter:
+    # Clients shared across exports so their HTTP connection pools stay warm, keyed by token hash
+    _clients: Dict[str, "Github"] = {}
+    
     def __init__(self, github_token: str):
         self.github_token = github_token
         self.github = None
         
         if GITHUB_PY_AVAILABLE:
-            try:
-                self.github = Github(github_token)
-            except Exception as e:
-                print(f"Warning: Could not initialize GitHub client: {e}")
+            client_key = hashlib.sha256(github_token.encode()).hexdigest()
+            self.github = GitHubExporter._clients.get(client_key)
+            if self.github is None:
+                try:
+                    from github import Github
+                    # One pooled connection per concurrent blob upload, so uploads reuse TLS sessions
+                    self.github = Github(github_token, pool_size=_MAX_CONCURRENT_UPLOADS)
+                    GitHubExporter._clients[client_key] = self.github
+                except Exception as e:
+                    print(f"Warning: Could not initialize GitHub client: {e}")
     
-    async def export_project(self, repo_name: str, organization: Optional[str] = None, project_path: str = ".") -> str:
+    async def export_project(self, repo_name: str, organization: Optional[str] = None, project_path: str = ".", archive: bool = False) -> str:
         """Export project to GitHub"""
         try:
-            # Method 1: Try using git commands (most reliable)
-            result = await self._export_via_git(repo_name, organization, project_path)
-            if result["success"]:
-                return result["message"]
+            if archive and self.github:
+                # Archive snapshot: one release asset upload instead of one upload per file
+                result = await self._export_via_archive(repo_name, organization, project_path)
+                if result["success"]:
+                    return result["message"]
+                print(f"Warning: {result['error']}, falling back to API export")
+            else:
+                # Method 1: Try using git commands (most reliable)
+                result = await self._export_via_git(repo_name, organization, project_path)
+                if result["success"]:
+                    return result["message"]
             
             # Method 2: Try using GitHub API
             if self.github:
@@ -50,55 +155,44 @@ class GitHubExporter:
         """Export using git commands"""
         try:
             # Check if git is available
-            git_check = subprocess.run(
-                ["git", "--version"],
-                capture_output=True,
-                text=True
-            )
-            
-            if git_check.returncode != 0:
+            if not _GIT_PATH:
                 return {
                     "success": False,
                     "error": "Git is not installed or not in PATH"
                 }
             
             # Initialize git repo if not already
-            if not os.path.exists(os.path.join(project_path, ".git")):
-                subprocess.run(
-                    ["git", "init"],
-                    cwd=project_path,
-                    capture_output=True
-                )
+            is_new_repo = not os.path.exists(os.path.join(project_path, ".git"))
+            if is_new_repo:
+                init_result = await _git(project_path, "init", "-b", "main")
+                if init_result.returncode != 0:
+                    # git < 2.28 has no -b; the push below targets main regardless
+                    await _git(project_path, "init")
                 
-                # Create .gitignore if not exists
-                gitignore_path = os.path.join(project_path, ".gitignore")
-                if not os.path.exists(gitignore_path):
-                    gitignore_content = """node_modules/
-dist/
-build/
-.env
-.env.local
-*.log
-.DS_Store
-.vscode/
-.idea/
-"""
-                    with open(gitignore_path, 'w') as f:
-                        f.write(gitignore_content)
-            
-            # Add all files
-            subprocess.run(
-                ["git", "add", "."],
-                cwd=project_path,
-                capture_output=True
-            )
+                # Create .gitignore if not exists; O_EXCL does the existence check in the open itself
+                try:
+                    fd = os.open(os.path.join(project_path, ".gitignore"), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                except FileExistsError:
+                    pass
+                else:
+                    try:
+                        os.write(fd, _GITIGNORE_BYTES)
+                    finally:
+                        os.close(fd)
             
-            # Commit
-            subprocess.run(
-                ["git", "commit", "-m", "Initial commit from Elite Software Builder"],
-                cwd=project_path,
-                capture_output=True
-            )
+            async def commit_all():
+                # An existing repo's own .gitignore need not list the reviewer's cache
+                await _exclude_from_git(project_path, b".review_cache/")
+                await _git(project_path, "add", ".")
+                await _git(project_path, "commit", "-m", "Initial commit from Elite Software Builder")
+            
+            # Creating the repo is a network round trip that does not depend on
+            # the local commit, so run it in a worker thread alongside add/commit
+            steps = [commit_all()]
+            if self.github:
+                loop = asyncio.get_running_loop()
+                steps.append(loop.run_in_executor(None, self._ensure_remote_repo, repo_name, organization))
+            await asyncio.gather(*steps)
             
             # Create remote URL
             if organization:
@@ -107,47 +201,16 @@ build/
                 # Try to get username from token or use a default
                 repo_url = f"https://{self.github_token}@github.com/{repo_name}.git"
             
-            # Add remote
-            subprocess.run(
-                ["git", "remote", "remove", "origin"],
-                cwd=project_path,
-                capture_output=True
-            )
-            subprocess.run(
-                ["git", "remote", "add", "origin", repo_url],
-                cwd=project_path,
-                capture_output=True
-            )
-            
-            # Push to GitHub
-            # First, try to create repo via API if possible
-            if self.github:
-                try:
-                    if organization:
-                        org = self.github.get_organization(organization)
-                        org.create_repo(repo_name, private=False)
-                    else:
-                        user = self.github.get_user()
-                        user.create_repo(repo_name, private=False)
-                except Exception:
-                    pass  # Repo might already exist, continue
-            
-            # Push
-            push_result = subprocess.run(
-                ["git", "push", "-u", "origin", "main"],
-                cwd=project_path,
-                capture_output=True,
-                text=True
-            )
+            # Point origin at the target repo; a fresh repo has no origin to update
+            remote_updated = False
+            if not is_new_repo:
+                remote_updated = (await _git(project_path, "remote", "set-url", "origin", repo_url)).returncode == 0
+            if not remote_updated:
+                await _git(project_path, "remote", "add", "origin", repo_url)
             
-            if push_result.returncode != 0:
-                # Try master branch
-                push_result = subprocess.run(
-                    ["git", "push", "-u", "origin", "master"],
-                    cwd=project_path,
-                    capture_output=True,
-                    text=True
-                )
+            # Push whatever branch is checked out straight to main, so there is
+            # no second attempt when the local default branch is master
+            push_result = await _git(project_path, "push", "--atomic", "-u", "origin", "HEAD:refs/heads/main")
             
             if push_result.returncode == 0:
                 if organization:
@@ -171,59 +234,187 @@ build/
                 "error": str(e)
             }
     
-    async def _export_via_api(self, repo_name: str, organization: Optional[str], project_path: str) -> Dict:
-        """Export using GitHub API (for cases where git is not available)"""
+    def _ensure_remote_repo(self, repo_name: str, organization: Optional[str]):
+        """Create the push target via the API, ignoring failures such as the repo already existing"""
         try:
-            # Create repository
             if organization:
                 org = self.github.get_organization(organization)
-                repo = org.create_repo(repo_name, private=False)
+                org.create_repo(repo_name, private=False)
             else:
                 user = self.github.get_user()
-                repo = user.create_repo(repo_name, private=False)
+                user.create_repo(repo_name, private=False)
+        except Exception:
+            pass  # Repo might already exist, continue
+    
+    def _create_repo(self, repo_name: str, organization: Optional[str]):
+        """Create the target repository, or reuse it if it already exists"""
+        from github import GithubException
+        
+        owner = self.github.get_organization(organization) if organization else self.github.get_user()
+        try:
+            # auto_init gives the repository a branch head, since the Git Data
+            # API and releases both reject an empty repository
+            return owner.create_repo(repo_name, private=False, auto_init=True)
+        except GithubException as e:
+            # 422 "name already exists" means the repo is there to reuse; any other error is a real failure
+            if e.status != 422 or "already exists" not in str(e.data):
+                raise
+        
+        repo = owner.get_repo(repo_name)
+        self._ensure_branch_head(repo)
+        return repo
+    
+    def _ensure_branch_head(self, repo):
+        """Give an empty repository, such as one created for a git push, a first commit"""
+        from github import GithubException
+        
+        try:
+            repo.get_git_ref(f"heads/{repo.default_branch or 'main'}")
+        except GithubException as e:
+            # 409 "Git Repository is empty"; the contents API, unlike the Git Data API, can write into it
+            if e.status != 409:
+                raise
+            repo.create_file("README.md", "Initialize repository", f"# {repo.name}\n")
+    
+    async def _export_via_archive(self, repo_name: str, organization: Optional[str], project_path: str) -> Dict:
+        """Export a gzipped tarball of the project as a single GitHub release asset"""
+        try:
+            # Compressing the tree and the API calls all block, so they run off the event loop
+            buffer, file_count = await asyncio.to_thread(self._build_archive, project_path)
+            repo = await asyncio.to_thread(self._create_repo, repo_name, organization)
+            
+            tag = time.strftime("snapshot-%Y%m%d-%H%M%S")
+            await asyncio.to_thread(self._upload_release_asset, repo, tag, buffer)
+            
+            return {
+                "success": True,
+                "message": f"Project snapshot exported to {repo.html_url}/releases/tag/{tag} ({file_count} files archived)"
+            }
+        
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Archive export failed: {str(e)}"
+            }
+    
+    def _build_archive(self, project_path: str) -> Tuple[BinaryIO, int]:
+        """Tar and gzip the project in memory, leaving out the directories .gitignore excludes"""
+        import io
+        import tarfile
+        
+        buffer = io.BytesIO()
+        file_count = 0
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+            for entry in _iter_project_files(project_path, _IGNORED_DIRS):
+                tar.add(entry.path, arcname=os.path.relpath(entry.path, project_path), recursive=False)
+                file_count += 1
+                if buffer.tell() > _ARCHIVE_MAX_BYTES:
+                    raise ValueError(f"snapshot exceeds {_ARCHIVE_MAX_BYTES // (1024 * 1024)}MB")
+        return buffer, file_count
+    
+    def _upload_release_asset(self, repo, tag: str, buffer: BinaryIO):
+        """Create the snapshot release and attach the archive to it"""
+        release = repo.create_git_release(
+            tag,
+            f"Elite Software Builder snapshot {tag}",
+            "Project snapshot exported by Elite Software Builder"
+        )
+        archive_size = buffer.tell()
+        buffer.seek(0)
+        release.upload_asset_from_memory(
+            buffer,
+            archive_size,
+            name="snapshot.tar.gz",
+            content_type="application/gzip"
+        )
+    
+    async def _export_via_api(self, repo_name: str, organization: Optional[str], project_path: str) -> Dict:
+        """Export using GitHub API (for cases where git is not available)"""
+        from github import InputGitTreeElement
+        
+        try:
+            # Create repository
+            repo = self._create_repo(repo_name, organization)
             
             # Get default branch
             default_branch = repo.default_branch or "main"
             
-            # Upload files
-            uploaded_files = 0
-            for root, dirs, files in os.walk(project_path):
-                # Skip .git directory
-                if ".git" in root:
+            # Blob shas already on the branch, fetched in one call so unchanged files are not re-uploaded
+            existing = self._existing_blob_shas(repo, default_branch)
+            
+            # Collect files to upload
+            files = []
+            kept_paths = []
+            for entry in _iter_project_files(project_path):
+                relative_path = os.path.relpath(entry.path, project_path).replace(os.sep, "/")
+                # Skip large files
+                size = entry.stat().st_size
+                if size > 1000000:  # 1MB limit
+                    # The new tree replaces the branch's, so keep a copy that is already there
+                    if relative_path in existing:
+                        kept_paths.append(relative_path)
                     continue
                 
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, project_path)
-                    
-                    # Skip large files
-                    if os.path.getsize(file_path) > 1000000:  # 1MB limit
-                        continue
-                    
-                    try:
-                        with open(file_path, 'rb') as f:
-                            content = f.read()
-                        
-                        # Try to decode as text
-                        try:
-                            content_str = content.decode('utf-8')
-                            repo.create_file(
-                                relative_path,
-                                f"Add {relative_path}",
-                                content_str,
-                                branch=default_branch
-                            )
-                            uploaded_files += 1
-                        except UnicodeDecodeError:
-                            # Binary file, skip for now
-                            pass
-                    except Exception as e:
-                        print(f"Warning: Could not upload {relative_path}: {e}")
+                files.append((relative_path, entry.path, size))
+            
+            # Upload every changed file as a blob concurrently; blobs are base64 so binary files work too
+            loop = asyncio.get_running_loop()
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_UPLOADS)
+            
+            async def upload(relative_path: str, file_path: str, size: int):
+                async with semaphore:
+                    return await loop.run_in_executor(
+                        None, self._create_blob, repo, file_path, size, existing.get(relative_path)
+                    )
+            
+            # gather keeps results in input order, so blob shas line up with files by position
+            blob_shas = await asyncio.gather(
+                *(upload(*file) for file in files),
+                return_exceptions=True
+            )
+            
+            # A tree missing a file would delete it from the branch, so any failed upload aborts the export
+            failed = [
+                (relative_path, blob_sha)
+                for (relative_path, _, _), blob_sha in zip(files, blob_shas)
+                if isinstance(blob_sha, Exception)
+            ]
+            if failed:
+                relative_path, error = failed[0]
+                return {
+                    "success": False,
+                    "error": f"API export failed: could not upload {len(failed)} of {len(files)} files (first: {relative_path}: {error})"
+                }
+            
+            tree_elements = [
+                InputGitTreeElement(path=relative_path, mode="100644", type="blob", sha=blob_sha)
+                for (relative_path, _, _), blob_sha in zip(files, blob_shas)
+            ]
+            tree_elements.extend(
+                InputGitTreeElement(path=relative_path, mode="100644", type="blob", sha=existing[relative_path])
+                for relative_path in kept_paths
+            )
+            if not tree_elements:
+                return {
+                    "success": False,
+                    "error": "API export failed: no files to upload"
+                }
+            
+            # One tree and one commit for the whole project, then move the branch to it
+            tree = repo.create_git_tree(tree_elements)
+            head = repo.get_git_ref(f"heads/{default_branch}")
+            parent = repo.get_git_commit(head.object.sha)
+            commit = repo.create_git_commit(
+                "Initial commit from Elite Software Builder",
+                tree,
+                [parent]
+            )
+            head.edit(commit.sha)
             
             repo_url = repo.html_url
             return {
                 "success": True,
-                "message": f"Project exported to {repo_url} ({uploaded_files} files uploaded)"
+                "message": f"Project exported to {repo_url} ({len(files)} files uploaded)"
             }
         
         except Exception as e:
@@ -231,3 +422,27 @@ build/
                 "success": False,
                 "error": f"API export failed: {str(e)}"
             }
+    
+    def _existing_blob_shas(self, repo, branch: str) -> Dict[str, str]:
+        """Map each file path on the branch to its blob sha"""
+        try:
+            tree = repo.get_git_tree(branch, recursive=True)
+        except Exception:
+            return {}
+        return {element.path: element.sha for element in tree.tree if element.type == "blob"}
+    
+    def _create_blob(self, repo, file_path: str, size: int, existing_sha: Optional[str] = None) -> str:
+        """Upload one file's content as a git blob unless the branch already has it, returning its sha"""
+        import base64
+        
+        with open(file_path, 'rb') as f:
+            # Hashing and base64 both read straight from the mapping for larger files
+            content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size > _MMAP_THRESHOLD else f.read()
+            try:
+                if existing_sha is not None and _git_blob_sha(content) == existing_sha:
+                    return existing_sha
+                encoded = base64.b64encode(content).decode("ascii")
+            finally:
+                if isinstance(content, mmap.mmap):
+                    content.close()
+        return repo.create_git_blob(encoded, "base64").sha
@@ -9,6 +9,12 @@ import sys
 import os
 import argparse
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -18,6 +24,11 @@ from elite_builder.config_manager import ConfigManager
 
 async def run_standalone(project_spec: str, goal: str, max_iterations: int = 50):
     """Run the builder in standalone mode"""
+    # Python 3.12+: new tasks run eagerly up to their first await, so the
+    # background install and review subprocesses start without a loop hop
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     print("=" * 60)
     print("ELITE SOFTWARE BUILDER")
     print("=" * 60)
@@ -55,6 +66,13 @@ async def run_standalone(project_spec: str, goal: str, max_iterations: int = 50)
     print(f"Project Path: {orchestrator.current_project_path}")
     print()
 
+def _run(coro):
+    """Run a coroutine to completion, on uvloop's faster event loop when it is installed"""
+    if UVLOOP_AVAILABLE:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    return asyncio.run(coro)
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Elite Software Builder")
@@ -86,14 +104,14 @@ def main():
     if args.mode == "mcp":
         # Run as MCP server
         print("Starting Elite Software Builder MCP Server...")
-        asyncio.run(mcp_main())
+        _run(mcp_main())
     elif args.mode == "standalone":
         # Run in standalone mode
         if not args.project_spec or not args.goal:
             print("Error: --project-spec and --goal are required for standalone mode")
             sys.exit(1)
         
-        asyncio.run(run_standalone(
+        _run(run_standalone(
             project_spec=args.project_spec,
             goal=args.goal,
             max_iterations=args.max_iterations
@@ -8,7 +8,7 @@ import asyncio
 import json
 import os
 import sys
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Tuple
 import subprocess
 
 # Add parent directory to path
@@ -18,6 +18,22 @@ from elite_builder.builder_agent import BuilderAgent
 from elite_builder.reviewer_agent import ReviewerAgent
 from elite_builder.orchestrator import Orchestrator
 from elite_builder.github_integration import GitHubExporter
+from elite_builder.utils import dump_json, load_json
+
+def _write_message(payload: bytes) -> None:
+    """Write one newline-terminated message to stdout with a single write call"""
+    data = payload + b"\n"
+    # Anything printed through the text layer must land before this message
+    sys.stdout.flush()
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+        return
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
 # MCP-compatible types (simplified implementation)
 class Resource:
@@ -38,27 +54,147 @@ class TextContent:
         self.type = type
         self.text = text
 
+# Tools and resources never change, so they and their list results are built once
+_RESOURCES = (
+    Resource(
+        uri="elite-builder://status",
+        name="Builder Status",
+        description="Current status of the Elite Software Builder",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="elite-builder://config",
+        name="Builder Configuration",
+        description="Current configuration of the builder",
+        mimeType="application/json"
+    )
+)
+
+_TOOLS = (
+    Tool(
+        name="start_build",
+        description="Start the Elite Software Builder with a project specification",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_spec": {
+                    "type": "string",
+                    "description": "Detailed specification of the website/SaaS to build"
+                },
+                "goal": {
+                    "type": "string",
+                    "description": "The exact goal to achieve (e.g., 'Fully functional e-commerce site with payment integration')"
+                },
+                "max_iterations": {
+                    "type": "integer",
+                    "description": "Maximum number of improvement iterations (default: 50)",
+                    "default": 50
+                }
+            },
+            "required": ["project_spec", "goal"]
+        }
+    ),
+    Tool(
+        name="get_build_status",
+        description="Get current status of the build process",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="stop_build",
+        description="Stop the current build process",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="export_to_github",
+        description="Export the built project to GitHub",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "repo_name": {
+                    "type": "string",
+                    "description": "GitHub repository name"
+                },
+                "github_token": {
+                    "type": "string",
+                    "description": "GitHub personal access token"
+                },
+                "organization": {
+                    "type": "string",
+                    "description": "GitHub organization (optional)"
+                },
+                "archive": {
+                    "type": "boolean",
+                    "description": "Upload a single tar.gz snapshot as a release asset instead of pushing individual files (default: false)",
+                    "default": False
+                }
+            },
+            "required": ["repo_name", "github_token"]
+        }
+    ),
+    Tool(
+        name="request_credentials",
+        description="Request API keys and credentials needed for the project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "required_services": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of services that need credentials (e.g., ['database', 'stripe', 'openai'])"
+                }
+            },
+            "required": ["required_services"]
+        }
+    )
+)
+
+_RESOURCES_LIST_RESULT = dump_json({
+    "resources": [
+        {
+            "uri": r.uri,
+            "name": r.name,
+            "description": r.description,
+            "mimeType": r.mimeType
+        }
+        for r in _RESOURCES
+    ]
+})
+
+_TOOLS_LIST_RESULT = dump_json({
+    "tools": [
+        {
+            "name": t.name,
+            "description": t.description,
+            "inputSchema": t.inputSchema
+        }
+        for t in _TOOLS
+    ]
+})
+
+def _result_message(request_id: Any, result_json: bytes) -> bytes:
+    """Wrap a pre-serialized result in a JSON-RPC response, splicing in only the id"""
+    return b'{"jsonrpc":"2.0","id":' + dump_json(request_id) + b',"result":' + result_json + b'}'
+
+_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "config.json")
+
 class EliteBuilderMCPServer:
     def __init__(self):
         self.orchestrator = None
         self.server_name = "elite-software-builder"
+        # (mtime_ns, text) of the last config.json read, so polling costs one stat
+        self._config_cache: Tuple[int, str] = (0, "")
     
     async def list_resources(self) -> List[Resource]:
         """List available resources"""
-        return [
-            Resource(
-                uri="elite-builder://status",
-                name="Builder Status",
-                description="Current status of the Elite Software Builder",
-                mimeType="application/json"
-            ),
-            Resource(
-                uri="elite-builder://config",
-                name="Builder Configuration",
-                description="Current configuration of the builder",
-                mimeType="application/json"
-            )
-        ]
+        return list(_RESOURCES)
     
     async def get_resource(self, uri: str) -> str:
         """Get resource content"""
@@ -70,95 +206,19 @@ class EliteBuilderMCPServer:
             return json.dumps(status, indent=2)
         elif uri == "elite-builder://config":
             # Return config if exists
-            config_path = os.path.join(os.path.dirname(__file__), "..", "config.json")
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    return f.read()
-            return json.dumps({"message": "No configuration found"}, indent=2)
+            try:
+                mtime_ns = os.stat(_CONFIG_PATH).st_mtime_ns
+            except FileNotFoundError:
+                return json.dumps({"message": "No configuration found"}, indent=2)
+            if mtime_ns != self._config_cache[0]:
+                with open(_CONFIG_PATH, 'r') as f:
+                    self._config_cache = (mtime_ns, f.read())
+            return self._config_cache[1]
         return ""
     
     async def list_tools(self) -> List[Tool]:
         """List available tools"""
-        return [
-            Tool(
-                name="start_build",
-                description="Start the Elite Software Builder with a project specification",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_spec": {
-                            "type": "string",
-                            "description": "Detailed specification of the website/SaaS to build"
-                        },
-                        "goal": {
-                            "type": "string",
-                            "description": "The exact goal to achieve (e.g., 'Fully functional e-commerce site with payment integration')"
-                        },
-                        "max_iterations": {
-                            "type": "integer",
-                            "description": "Maximum number of improvement iterations (default: 50)",
-                            "default": 50
-                        }
-                    },
-                    "required": ["project_spec", "goal"]
-                }
-            ),
-            Tool(
-                name="get_build_status",
-                description="Get current status of the build process",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-            Tool(
-                name="stop_build",
-                description="Stop the current build process",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-            Tool(
-                name="export_to_github",
-                description="Export the built project to GitHub",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "repo_name": {
-                            "type": "string",
-                            "description": "GitHub repository name"
-                        },
-                        "github_token": {
-                            "type": "string",
-                            "description": "GitHub personal access token"
-                        },
-                        "organization": {
-                            "type": "string",
-                            "description": "GitHub organization (optional)"
-                        }
-                    },
-                    "required": ["repo_name", "github_token"]
-                }
-            ),
-            Tool(
-                name="request_credentials",
-                description="Request API keys and credentials needed for the project",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "required_services": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of services that need credentials (e.g., ['database', 'stripe', 'openai'])"
-                        }
-                    },
-                    "required": ["required_services"]
-                }
-            )
-        ]
+        return list(_TOOLS)
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         """Handle tool calls"""
@@ -229,6 +289,7 @@ class EliteBuilderMCPServer:
                 result = await exporter.export_project(
                     repo_name=repo_name,
                     organization=organization,
+                    archive=bool(arguments.get("archive", False)),
                     project_path=os.path.join(os.path.dirname(__file__), "..", "projects", "current")
                 )
                 
@@ -261,6 +322,63 @@ class EliteBuilderMCPServer:
                 text=f"Error: {str(e)}"
             )]
 
+async def _handle_tools_list(server: EliteBuilderMCPServer, request: Dict, params: Dict):
+    """Answer tools/list from the pre-serialized tool list"""
+    _write_message(_result_message(request.get("id"), _TOOLS_LIST_RESULT))
+
+async def _handle_tools_call(server: EliteBuilderMCPServer, request: Dict, params: Dict):
+    """Run a tool and return its text content"""
+    tool_name = params.get("name")
+    arguments = params.get("arguments", {})
+    results = await server.call_tool(tool_name, arguments)
+    result = {
+        "content": [
+            {"type": r.type, "text": r.text}
+            for r in results
+        ]
+    }
+    _write_message(_result_message(request.get("id"), dump_json(result)))
+
+async def _handle_resources_list(server: EliteBuilderMCPServer, request: Dict, params: Dict):
+    """Answer resources/list from the pre-serialized resource list"""
+    _write_message(_result_message(request.get("id"), _RESOURCES_LIST_RESULT))
+
+async def _handle_resources_read(server: EliteBuilderMCPServer, request: Dict, params: Dict):
+    """Return the content of one resource"""
+    uri = params.get("uri")
+    content = await server.get_resource(uri)
+    result = {
+        "contents": [
+            {
+                "uri": uri,
+                "mimeType": "application/json",
+                "text": content
+            }
+        ]
+    }
+    _write_message(_result_message(request.get("id"), dump_json(result)))
+
+# JSON-RPC method -> handler; each handler writes its own response
+_DISPATCH = {
+    "tools/list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+    "resources/list": _handle_resources_list,
+    "resources/read": _handle_resources_read,
+}
+
+# StreamReader's default 64KB line limit is too small for large tool arguments
+_STDIN_LINE_LIMIT = 16 * 1024 * 1024
+
+async def _open_stdin_reader() -> Optional[asyncio.StreamReader]:
+    """Attach stdin to the event loop, or return None where it cannot be (regular files, some Windows loops)"""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=_STDIN_LINE_LIMIT)
+    try:
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    except (ValueError, NotImplementedError, OSError):
+        return None
+    return reader
+
 async def main():
     """Main entry point for MCP server - runs as stdio server"""
     server = EliteBuilderMCPServer()
@@ -272,93 +390,29 @@ async def main():
     print("Elite Software Builder MCP Server", file=sys.stderr)
     print("Listening for MCP requests on stdin/stdout", file=sys.stderr)
     
+    # Read stdin on the event loop itself so no executor thread sits blocked in readline
+    reader = await _open_stdin_reader()
+    loop = asyncio.get_running_loop()
+    
     # For a full implementation, you would use an MCP library
     # For now, we'll provide a simple interface
     while True:
         try:
-            line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+            if reader is not None:
+                line = await reader.readline()
+            else:
+                line = await loop.run_in_executor(None, sys.stdin.buffer.readline)
             if not line:
                 break
             
             try:
-                request = json.loads(line.strip())
+                request = load_json(line.strip())
                 method = request.get("method")
                 params = request.get("params", {})
                 
-                if method == "tools/list":
-                    tools = await server.list_tools()
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request.get("id"),
-                        "result": {
-                            "tools": [
-                                {
-                                    "name": t.name,
-                                    "description": t.description,
-                                    "inputSchema": t.inputSchema
-                                }
-                                for t in tools
-                            ]
-                        }
-                    }
-                    print(json.dumps(response))
-                    sys.stdout.flush()
-                
-                elif method == "tools/call":
-                    tool_name = params.get("name")
-                    arguments = params.get("arguments", {})
-                    results = await server.call_tool(tool_name, arguments)
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request.get("id"),
-                        "result": {
-                            "content": [
-                                {"type": r.type, "text": r.text}
-                                for r in results
-                            ]
-                        }
-                    }
-                    print(json.dumps(response))
-                    sys.stdout.flush()
-                
-                elif method == "resources/list":
-                    resources = await server.list_resources()
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request.get("id"),
-                        "result": {
-                            "resources": [
-                                {
-                                    "uri": r.uri,
-                                    "name": r.name,
-                                    "description": r.description,
-                                    "mimeType": r.mimeType
-                                }
-                                for r in resources
-                            ]
-                        }
-                    }
-                    print(json.dumps(response))
-                    sys.stdout.flush()
-                
-                elif method == "resources/read":
-                    uri = params.get("uri")
-                    content = await server.get_resource(uri)
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request.get("id"),
-                        "result": {
-                            "contents": [
-                                {
-                                    "uri": uri,
-                                    "mimeType": "application/json",
-                                    "text": content
-                                }
-                            ]
-                        }
-                    }
-                    print(json.dumps(response))
-                    sys.stdout.flush()
+                handler = _DISPATCH.get(method)
+                if handler is not None:
+                    await handler(server, request, params)
             
             except json.JSONDecodeError:
                 pass
@@ -371,8 +425,7 @@ async def main():
                         "message": str(e)
                     }
                 }
-                print(json.dumps(error_response))
-                sys.stdout.flush()
+                _write_message(dump_json(error_response))
         
         except KeyboardInterrupt:
             break
@@ -4,15 +4,40 @@ Orchestrator - Manages the loop between Builder and Reviewer agents
 """
 
 import os
-import json
+import re
 import asyncio
 import time
+from collections import deque
 from typing import Dict, Optional
 from datetime import datetime
 
 from elite_builder.builder_agent import BuilderAgent
 from elite_builder.reviewer_agent import ReviewerAgent
 from elite_builder.config_manager import ConfigManager
+from elite_builder.utils import dump_json_indented, dump_json_line
+
+# Feature -> feedback keywords that call for it; order sets the order features are picked in
+_FEATURE_KEYWORDS = {
+    "navigation": ("navigation", "navbar", "menu"),
+    "hero": ("hero", "banner", "landing"),
+    "authentication": ("auth", "login", "signup", "authentication"),
+    "api": ("api", "backend", "service"),
+    "database": ("database", "db", "data"),
+    "responsive": ("responsive", "mobile", "responsive design"),
+    "styling": ("styling", "css", "design", "ui"),
+    "components": ("component", "module")
+}
+
+# One pattern for every keyword. Each alternative sits in a lookahead so matches
+# never consume text, which keeps overlapping keywords of different features
+# (such as "design" inside "responsive design") visible, as substring checks did
+_FEATURE_RE = re.compile("(?=" + "|".join(
+    f"(?P<{feature}>" + "|".join(map(re.escape, keywords)) + ")"
+    for feature, keywords in _FEATURE_KEYWORDS.items()
+) + ")")
+
+# Iterations kept in memory for status; every entry is also appended to the history log
+_HISTORY_IN_MEMORY = 100
 
 class Orchestrator:
     def __init__(self, project_spec: str, goal: str, max_iterations: int = 50):
@@ -36,125 +61,159 @@ class Orchestrator:
         self.builder = BuilderAgent(self.current_project_path, self.config)
         self.reviewer = ReviewerAgent(self.current_project_path, self.goal)
         
-        # History
-        self.history = []
+        # History; only recent entries stay in memory, the full log is appended to build_history.jsonl
+        self.history = deque(maxlen=_HISTORY_IN_MEMORY)
+        self.history_log_path = os.path.join(self.current_project_path, "build_history.jsonl")
+        # Maintained as entries are recorded, so status polls do not scan the history
+        self._goal_met = False
+        self._last_score = 0
         self.start_time = None
+        # Elapsed time is measured on the monotonic clock; start_time is kept for display
+        self._start_monotonic = None
     
     async def run(self):
         """Run the builder-reviewer loop"""
         self.is_running = True
         self.is_stopped = False
         self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
         
         print(f"[Orchestrator] Starting Elite Software Builder")
         print(f"[Orchestrator] Goal: {self.goal}")
         print(f"[Orchestrator] Max iterations: {self.max_iterations}")
         
         # Initial project creation
+        install_task = None
         if self.current_iteration == 0:
+            # A fresh build starts a fresh history log
+            open(self.history_log_path, 'w').close()
+            
             print(f"[Orchestrator] Creating initial project structure...")
             result = self.builder.create_project_structure()
             if not result.get("success"):
                 print(f"[Orchestrator] Error creating project: {result.get('error')}")
                 self.is_running = False
                 return
-        
-        # Main loop
-        while self.current_iteration < self.max_iterations and not self.is_stopped:
-            self.current_iteration += 1
-            print(f"\n[Orchestrator] === Iteration {self.current_iteration} ===")
-            
-            # Step 1: Reviewer reviews the project
-            print(f"[Orchestrator] Reviewer analyzing project...")
-            review = self.reviewer.review_project(self.current_iteration)
-            
-            review_summary = {
-                "iteration": self.current_iteration,
-                "score": review.get("score", 0),
-                "meets_goal": review.get("meets_goal", False),
-                "feedback_count": len(review.get("feedback", []))
-            }
             
-            print(f"[Orchestrator] Review Score: {review_summary['score']:.1f}/100")
-            print(f"[Orchestrator] Meets Goal: {review_summary['meets_goal']}")
-            
-            # Check if goal is met
-            if review.get("meets_goal", False):
-                print(f"[Orchestrator] ✓ Goal achieved! Stopping loop.")
-                self.history.append({
+            # package.json is final once the scaffold exists, so npm install can
+            # run in the background while the first review and features proceed
+            print(f"[Orchestrator] Installing dependencies...")
+            install_task = asyncio.create_task(self.builder.install_dependencies())
+        
+        try:
+            # Main loop
+            while self.current_iteration < self.max_iterations and not self.is_stopped:
+                self.current_iteration += 1
+                print(f"\n[Orchestrator] === Iteration {self.current_iteration} ===")
+                
+                # Step 1: Reviewer reviews the project
+                print(f"[Orchestrator] Reviewer analyzing project...")
+                review = await self.reviewer.review_project(self.current_iteration)
+                
+                review_summary = {
                     "iteration": self.current_iteration,
-                    "action": "goal_achieved",
-                    "review": review_summary
+                    "score": review.get("score", 0),
+                    "meets_goal": review.get("meets_goal", False),
+                    "feedback_count": len(review.get("feedback", []))
+                }
+                
+                print(f"[Orchestrator] Review Score: {review_summary['score']:.1f}/100")
+                print(f"[Orchestrator] Meets Goal: {review_summary['meets_goal']}")
+                
+                # Check if goal is met
+                if review.get("meets_goal", False):
+                    print(f"[Orchestrator] ✓ Goal achieved! Stopping loop.")
+                    self._record_history({
+                        "iteration": self.current_iteration,
+                        "action": "goal_achieved",
+                        "review": review_summary
+                    })
+                    break
+                
+                # Step 2: Builder implements improvements based on feedback
+                print(f"[Orchestrator] Builder implementing improvements...")
+                feedback = review.get("feedback", [])
+                suggestions = self.reviewer.get_improvement_suggestions()
+                
+                # Extract features to implement from feedback and project spec
+                features_to_implement = self._extract_features_from_feedback(feedback, suggestions)
+                
+                if features_to_implement:
+                    build_result = self.builder.implement_features(features_to_implement, "\n".join(feedback))
+                    print(f"[Orchestrator] Builder result: {build_result.get('message', 'Completed')}")
+                else:
+                    print(f"[Orchestrator] No specific features to implement, continuing...")
+                
+                # Step 3: Wait for the dependency install started after project creation
+                if install_task is not None:
+                    await self._finish_install(install_task)
+                    install_task = None
+                
+                # Step 4: Build project to check for errors
+                if self.current_iteration % 3 == 0:  # Build every 3 iterations
+                    print(f"[Orchestrator] Building project...")
+                    build_result = await self.builder.build_project()
+                    if build_result.get("success"):
+                        print(f"[Orchestrator] Build successful")
+                    else:
+                        print(f"[Orchestrator] Build errors: {build_result.get('error', 'Unknown')[:200]}")
+                
+                # Save iteration history
+                self._record_history({
+                    "iteration": self.current_iteration,
+                    "review": review_summary,
+                    "features_implemented": features_to_implement,
+                    "timestamp": datetime.now().isoformat()
                 })
-                break
-            
-            # Step 2: Builder implements improvements based on feedback
-            print(f"[Orchestrator] Builder implementing improvements...")
-            feedback = review.get("feedback", [])
-            suggestions = self.reviewer.get_improvement_suggestions()
-            
-            # Extract features to implement from feedback and project spec
-            features_to_implement = self._extract_features_from_feedback(feedback, suggestions)
             
-            if features_to_implement:
-                build_result = self.builder.implement_features(features_to_implement, "\n".join(feedback))
-                print(f"[Orchestrator] Builder result: {build_result.get('message', 'Completed')}")
-            else:
-                print(f"[Orchestrator] No specific features to implement, continuing...")
+            # Final review
+            if not self.is_stopped:
+                print(f"\n[Orchestrator] === Final Review ===")
+                final_review = await self.reviewer.review_project(self.current_iteration + 1)
+                print(f"[Orchestrator] Final Score: {final_review.get('score', 0):.1f}/100")
+                print(f"[Orchestrator] Goal Met: {final_review.get('meets_goal', False)}")
+                
+                self._record_history({
+                    "iteration": self.current_iteration + 1,
+                    "action": "final_review",
+                    "review": {
+                        "score": final_review.get("score", 0),
+                        "meets_goal": final_review.get("meets_goal", False)
+                    }
+                })
             
-            # Step 3: Install dependencies if needed
-            if self.current_iteration == 1:
-                print(f"[Orchestrator] Installing dependencies...")
-                install_result = self.builder.install_dependencies()
-                if install_result.get("success"):
-                    print(f"[Orchestrator] Dependencies installed")
-                else:
-                    print(f"[Orchestrator] Dependency installation issue: {install_result.get('error')}")
+            # The loop can end before iteration 1 reached the install step
+            if install_task is not None and not self.is_stopped:
+                await self._finish_install(install_task)
+                install_task = None
+        finally:
+            # A stop or an error abandons the install; cancelling it kills npm
+            if install_task is not None and not install_task.done():
+                install_task.cancel()
+                try:
+                    await install_task
+                except asyncio.CancelledError:
+                    pass
             
-            # Step 4: Build project to check for errors
-            if self.current_iteration % 3 == 0:  # Build every 3 iterations
-                print(f"[Orchestrator] Building project...")
-                build_result = self.builder.build_project()
-                if build_result.get("success"):
-                    print(f"[Orchestrator] Build successful")
-                else:
-                    print(f"[Orchestrator] Build errors: {build_result.get('error', 'Unknown')[:200]}")
+            # Stop the reviewer's background TypeScript compiler
+            await self.reviewer.close()
             
-            # Save iteration history
-            self.history.append({
-                "iteration": self.current_iteration,
-                "review": review_summary,
-                "features_implemented": features_to_implement,
-                "timestamp": datetime.now().isoformat()
-            })
+            # Save history
+            self._save_history()
             
-            # Small delay between iterations
-            await asyncio.sleep(2)
-        
-        # Final review
-        if not self.is_stopped:
-            print(f"\n[Orchestrator] === Final Review ===")
-            final_review = self.reviewer.review_project(self.current_iteration + 1)
-            print(f"[Orchestrator] Final Score: {final_review.get('score', 0):.1f}/100")
-            print(f"[Orchestrator] Goal Met: {final_review.get('meets_goal', False)}")
-            
-            self.history.append({
-                "iteration": self.current_iteration + 1,
-                "action": "final_review",
-                "review": {
-                    "score": final_review.get("score", 0),
-                    "meets_goal": final_review.get("meets_goal", False)
-                }
-            })
-        
-        # Save history
-        self._save_history()
-        
-        self.is_running = False
-        elapsed = (datetime.now() - self.start_time).total_seconds() if self.start_time else 0
+            self.is_running = False
+        elapsed = self._elapsed_time()
         print(f"\n[Orchestrator] Build process completed in {elapsed:.1f} seconds")
         print(f"[Orchestrator] Total iterations: {self.current_iteration}")
     
+    async def _finish_install(self, install_task: asyncio.Task):
+        """Wait for the background dependency install and report its outcome"""
+        install_result = await install_task
+        if install_result.get("success"):
+            print(f"[Orchestrator] Dependencies installed")
+        else:
+            print(f"[Orchestrator] Dependency installation issue: {install_result.get('error')}")
+    
     def _extract_features_from_feedback(self, feedback: list, suggestions: list) -> list:
         """Extract features to implement from feedback"""
         features = []
@@ -163,23 +222,11 @@ class Orchestrator:
         all_feedback = feedback + suggestions
         
         # Extract feature requests
-        feature_keywords = {
-            "navigation": ["navigation", "navbar", "menu"],
-            "hero": ["hero", "banner", "landing"],
-            "authentication": ["auth", "login", "signup", "authentication"],
-            "api": ["api", "backend", "service"],
-            "database": ["database", "db", "data"],
-            "responsive": ["responsive", "mobile", "responsive design"],
-            "styling": ["styling", "css", "design", "ui"],
-            "components": ["component", "module"]
-        }
-        
         for item in all_feedback:
-            item_lower = item.lower()
-            for feature, keywords in feature_keywords.items():
-                if any(keyword in item_lower for keyword in keywords):
-                    if feature not in features:
-                        features.append(feature)
+            found = {match.lastgroup for match in _FEATURE_RE.finditer(item.lower())}
+            for feature in _FEATURE_KEYWORDS:
+                if feature in found and feature not in features:
+                    features.append(feature)
         
         # If no specific features found, add generic improvements
         if not features:
@@ -187,17 +234,27 @@ class Orchestrator:
         
         return features[:5]  # Limit to 5 features per iteration
     
+    def _record_history(self, entry: Dict):
+        """Remember a history entry and append it to the history log as one JSON line"""
+        self.history.append(entry)
+        review = entry.get("review", {})
+        self._last_score = review.get("score", 0)
+        if review.get("meets_goal", False):
+            self._goal_met = True
+        with open(self.history_log_path, 'ab') as f:
+            f.write(dump_json_line(entry))
+    
     def _save_history(self):
-        """Save build history"""
+        """Save the build summary; per-iteration entries are already in the history log"""
         history_path = os.path.join(self.current_project_path, "build_history.json")
-        with open(history_path, 'w') as f:
-            json.dump({
+        with open(history_path, 'wb') as f:
+            f.write(dump_json_indented({
                 "project_spec": self.project_spec,
                 "goal": self.goal,
                 "total_iterations": self.current_iteration,
-                "history": self.history,
+                "history_log": os.path.basename(self.history_log_path),
                 "completed_at": datetime.now().isoformat()
-            }, f, indent=2)
+            }))
     
     def get_status(self) -> Dict:
         """Get current status"""
@@ -206,14 +263,15 @@ class Orchestrator:
             "current_iteration": self.current_iteration,
             "max_iterations": self.max_iterations,
             "goal": self.goal,
-            "goal_met": any(
-                h.get("review", {}).get("meets_goal", False)
-                for h in self.history
-            ) if self.history else False,
-            "latest_score": self.history[-1].get("review", {}).get("score", 0) if self.history else 0,
-            "elapsed_time": (datetime.now() - self.start_time).total_seconds() if self.start_time else 0
+            "goal_met": self._goal_met,
+            "latest_score": self._last_score,
+            "elapsed_time": self._elapsed_time()
         }
     
+    def _elapsed_time(self) -> float:
+        """Seconds since run() started, or 0 before it has"""
+        return time.monotonic() - self._start_monotonic if self._start_monotonic is not None else 0
+    
     def stop(self):
         """Stop the build process"""
         self.is_stopped = True
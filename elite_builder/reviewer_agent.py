@@ -4,18 +4,280 @@ Reviewer Agent - Reviews websites and provides feedback for improvement
 """
 
 import os
+import re
 import json
-import subprocess
-from typing import Dict, List, Optional
-from pathlib import Path
+import time
+import atexit
+import asyncio
+import hashlib
+import weakref
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+from elite_builder.utils import NEW_PROCESS_GROUP, dump_json, kill_process_group, load_json, reap
+
+# Goal phrase -> code keywords that show the project addresses it
+_GOAL_KEYWORDS = {
+    "e-commerce": ("cart", "checkout", "payment", "product", "shop"),
+    "dashboard": ("dashboard", "chart", "analytics", "metrics"),
+    "authentication": ("login", "auth", "signup", "user"),
+    "api": ("api", "fetch", "axios", "service"),
+    "database": ("database", "db", "postgres", "mongo"),
+    "responsive": ("responsive", "mobile", "tailwind", "css")
+}
+
+def _build_keyword_automaton():
+    """Build one Aho-Corasick automaton over every goal keyword, so a single pass finds them all"""
+    automaton = ahocorasick.Automaton()
+    for keywords in _GOAL_KEYWORDS.values():
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Scaffold paths the structure check expects, relative to the project root
+_REQUIRED_FILES = (
+    "package.json",
+    "vite.config.ts",
+    "tsconfig.json",
+    "index.html",
+    "src/main.tsx",
+    "src/App.tsx"
+)
+_REQUIRED_DIRS = ("src/components", "src/sections", "src/utils")
+
+# One bit per check; the checks a review passes fold into a mask that scoring and goal evaluation test
+_CHECK_BITS = {
+    "structure": 1 << 0,
+    "code_quality": 1 << 1,
+    "functionality": 1 << 2,
+    "goal_alignment": 1 << 3,
+    "best_practices": 1 << 4
+}
+# Critical checks plus goal alignment; all must pass for the goal to be met
+_GOAL_REQUIRED_MASK = _CHECK_BITS["structure"] | _CHECK_BITS["functionality"] | _CHECK_BITS["goal_alignment"]
+
+# Reviews are cached on disk under the project, keyed by a fingerprint of its files
+_REVIEW_CACHE_DIR = ".review_cache"
+# Directories that do not affect a review (or are the cache itself) stay out of the fingerprint
+_FINGERPRINT_SKIP_DIRS = frozenset({"node_modules", "dist", ".git", _REVIEW_CACHE_DIR})
+# The orchestrator's history files change after every review without changing what a review sees
+_FINGERPRINT_SKIP_FILES = frozenset({"build_history.json", "build_history.jsonl"})
+
+# Source files every check may look at; read once per review into a shared snapshot
+_SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+_TYPESCRIPT_EXTENSIONS = ('.ts', '.tsx')
+# File reads release the GIL, so snapshots with more files than this are read on a pool
+_PARALLEL_READ_MIN_FILES = 8
+_READ_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4), thread_name_prefix="review-read")
+
+# Code quality reports at most this many issues and positives each
+_CODE_QUALITY_LIST_LIMIT = 10
+
+# The word "any" on its own, so identifiers like "company" are not flagged
+_ANY_TYPE_RE = re.compile(r'\bany\b')
+
+class _SourceFile(NamedTuple):
+    name: str
+    content: str
+    lowered: str
+    mtime_ns: int = 0
+    error: Optional[Exception] = None
+
+_TSC_COMMAND = ("npx", "tsc", "--noEmit")
+_TSC_TIMEOUT = 30  # seconds
+# Only the start of tsc's output is reported, so only that much is kept in memory
+_TSC_OUTPUT_LIMIT = 2048
+
+async def _read_output_head(proc: asyncio.subprocess.Process, limit: int) -> bytes:
+    """Keep the first limit bytes of a process's stdout and wait for it to exit"""
+    head = bytearray()
+    while len(head) < limit:
+        chunk = await proc.stdout.read(limit - len(head))
+        if not chunk:
+            break
+        head += chunk
+    # Discard the rest rather than stop reading, so the process never blocks on a full pipe
+    while await proc.stdout.read(64 * 1024):
+        pass
+    await proc.wait()
+    return bytes(head)
+
+# Long-lived compiler; after the first full check it only re-checks what changed
+_TSC_WATCH_COMMAND = ("npx", "tsc", "--noEmit", "--watch", "--pretty", "false", "--preserveWatchOutput")
+# Status lines tsc --watch prints around each compile
+_TSC_WATCH_START_RE = re.compile(r" - (?:Starting compilation|File change detected)")
+_TSC_WATCH_DONE_RE = re.compile(r" - Found (\d+) errors?\b")
+# Stream buffer for the watcher's output; a diagnostic line can outgrow asyncio's 64 KiB default
+_TSC_WATCH_LINE_LIMIT = 1024 * 1024  # bytes
+
+class _TscWatchResult(NamedTuple):
+    started_ns: int  # wall clock when the compile began, comparable with file mtimes
+    error_count: int
+    output: str
+
+class _TscInputs(NamedTuple):
+    fingerprint: str  # identifies everything tsc's verdict depends on
+    sources: FrozenSet[str]  # TypeScript files under src/
+    newest_source_ns: int  # newest mtime among those files and tsconfig.json
+    newest_tree_ns: int  # newest mtime among src/ and its subdirectories, moved by adds, deletes and renames
+    newest_dependency_ns: int  # newest mtime of package.json and node_modules
+
+class _TscWatcher:
+    """A `tsc --watch` process whose latest diagnostics can be awaited"""
+    
+    def __init__(self, project_path: str):
+        self.project_path = project_path
+        self.started_ns = 0
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._updated: Optional[asyncio.Event] = None
+        self._result: Optional[_TscWatchResult] = None
+        # The set of sources the last accepted result was known to cover
+        self._confirmed_sources: Optional[FrozenSet[str]] = None
+    
+    async def start(self):
+        """Launch the compiler and the task that follows its output"""
+        self._proc = await asyncio.create_subprocess_exec(
+            *_TSC_WATCH_COMMAND,
+            cwd=self.project_path,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=NEW_PROCESS_GROUP,
+            limit=_TSC_WATCH_LINE_LIMIT
+        )
+        self.started_ns = time.time_ns()
+        self._loop = asyncio.get_running_loop()
+        self._updated = asyncio.Event()
+        self._reader = asyncio.create_task(self._follow_output())
+        _LIVE_TSC_WATCHERS.add(self)
+    
+    def is_usable(self) -> bool:
+        """Whether the compiler is still running and bound to the current event loop"""
+        return (
+            self._proc is not None
+            and self._proc.returncode is None
+            and self._loop is asyncio.get_running_loop()
+        )
+    
+    async def _follow_output(self):
+        """Publish a result each time a compile finishes"""
+        started_ns = time.time_ns()
+        output = bytearray()
+        try:
+            while True:
+                line = await self._read_line()
+                if not line:
+                    break
+                text = line.decode(errors="replace")
+                if _TSC_WATCH_START_RE.search(text):
+                    started_ns = time.time_ns()
+                    output.clear()
+                    continue
+                done = _TSC_WATCH_DONE_RE.search(text)
+                if done:
+                    self._result = _TscWatchResult(started_ns, int(done.group(1)), output.decode(errors="replace"))
+                    self._updated.set()
+                    continue
+                if len(output) < _TSC_OUTPUT_LIMIT:
+                    output += line[:_TSC_OUTPUT_LIMIT - len(output)]
+        finally:
+            # Wake any waiter so it notices the compiler is gone
+            self._updated.set()
+    
+    async def _read_line(self) -> bytes:
+        """Read up to the next newline, keeping only the head of a line longer than the stream limit"""
+        line = bytearray()
+        while True:
+            try:
+                chunk = await self._proc.stdout.readuntil(b"\n")
+                complete = True
+            except asyncio.IncompleteReadError as e:
+                chunk = e.partial  # End of output
+                complete = True
+            except asyncio.LimitOverrunError as e:
+                # Take what is buffered and keep reading, where readline() would
+                # raise ValueError and end the reader while tsc is still running
+                chunk = await self._proc.stdout.read(e.consumed)
+                complete = False
+            line += chunk[:max(0, _TSC_OUTPUT_LIMIT - len(line))]
+            if complete:
+                return bytes(line)
+    
+    def _covers(self, result: _TscWatchResult, inputs: _TscInputs) -> bool:
+        """Whether a compile saw the current contents and the current set of source files"""
+        if result.started_ns <= inputs.newest_source_ns:
+            return False
+        # A file added, deleted or renamed since the last confirmed compile only shows
+        # up in its directory's mtime, so the compile must also postdate every directory
+        return inputs.sources == self._confirmed_sources or result.started_ns > inputs.newest_tree_ns
+    
+    async def result_for(self, inputs: _TscInputs, timeout: float) -> Optional[_TscWatchResult]:
+        """Wait for a compile that covers inputs; None if the compiler exits first"""
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._result is not None and self._covers(self._result, inputs):
+                self._confirmed_sources = inputs.sources
+                return self._result
+            if self._reader.done():
+                return None
+            self._updated.clear()
+            await asyncio.wait_for(self._updated.wait(), max(0.0, deadline - time.monotonic()))
+    
+    def kill(self):
+        """Stop the compiler without needing its event loop"""
+        _LIVE_TSC_WATCHERS.discard(self)
+        if self._proc is not None:
+            # The whole group, since tsc itself runs under npx and can outlive it
+            try:
+                kill_process_group(self._proc)
+            except RuntimeError:
+                pass  # Direct-child fallback on a closed loop
+    
+    async def close(self):
+        """Stop the compiler and its output task"""
+        self.kill()
+        if self._reader is not None and self._loop is asyncio.get_running_loop():
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            await reap(self._proc)
+
+# Watchers still running at interpreter exit have their process groups killed,
+# so no tsc outlives the builder
+_LIVE_TSC_WATCHERS = weakref.WeakSet()
+
+@atexit.register
+def _kill_tsc_watchers():
+    for watcher in list(_LIVE_TSC_WATCHERS):
+        watcher.kill()
 
 class ReviewerAgent:
     def __init__(self, project_path: str, goal: str):
         self.project_path = project_path
         self.goal = goal
         self.review_history = []
+        # path -> (mtime_ns, size, content, lowercased content); unchanged files are not re-read
+        self._content_cache: Dict[str, Tuple[int, int, str, str]] = {}
+        # (inputs fingerprint, (issues, positives)) of the last completed tsc run
+        self._last_tsc: Optional[Tuple[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]] = None
+        # Started on the first TypeScript check
+        self._tsc_watcher: Optional[_TscWatcher] = None
     
-    def review_project(self, iteration: int) -> Dict:
+    async def review_project(self, iteration: int) -> Dict:
         """Review the entire project and provide feedback"""
         review = {
             "iteration": iteration,
@@ -26,52 +288,119 @@ class ReviewerAgent:
             "meets_goal": False
         }
         
-        # Run various checks
-        review["checks"]["structure"] = self._check_project_structure()
-        review["checks"]["code_quality"] = self._check_code_quality()
-        review["checks"]["functionality"] = self._check_functionality()
-        review["checks"]["goal_alignment"] = self._check_goal_alignment()
-        review["checks"]["best_practices"] = self._check_best_practices()
+        # An unchanged project gets its earlier review back without re-running any check
+        fingerprint, cached = await asyncio.to_thread(self._lookup_cached_review)
+        if cached is not None:
+            cached["iteration"] = iteration
+            cached["timestamp"] = review["timestamp"]
+            self.review_history.append(cached)
+            return cached
+        
+        # List the project layout and read each source file once, then hand the same snapshot to every check
+        present, files = await asyncio.to_thread(self._snapshot_project)
+        
+        # Run the checks concurrently; the blocking filesystem checks go to worker threads
+        structure, code_quality, functionality, goal_alignment, best_practices = await asyncio.gather(
+            asyncio.to_thread(self._check_project_structure, present),
+            self._check_code_quality(files),
+            asyncio.to_thread(self._check_functionality, files),
+            asyncio.to_thread(self._check_goal_alignment, files),
+            asyncio.to_thread(self._check_best_practices, present, files)
+        )
+        review["checks"]["structure"] = structure
+        review["checks"]["code_quality"] = code_quality
+        review["checks"]["functionality"] = functionality
+        review["checks"]["goal_alignment"] = goal_alignment
+        review["checks"]["best_practices"] = best_practices
+        
+        # Statuses are compared once here; the rest works on the mask of passed checks
+        passed = self._passed_mask(review["checks"])
         
         # Calculate score
-        review["score"] = self._calculate_score(review["checks"])
+        review["score"] = self._calculate_score(review["checks"], passed)
         
         # Generate feedback
-        review["feedback"] = self._generate_feedback(review["checks"])
+        review["feedback"] = self._generate_feedback(review["checks"], passed)
         
         # Check if goal is met
-        review["meets_goal"] = self._evaluate_goal(review)
+        review["meets_goal"] = self._evaluate_goal(review["score"], passed)
         
+        # A timed-out or failed TypeScript check is retried next time rather than cached
+        if not code_quality.get("tsc_unconfirmed"):
+            await asyncio.to_thread(self._store_cached_review, fingerprint, review)
         self.review_history.append(review)
         
         return review
     
-    def _check_project_structure(self) -> Dict:
+    def _project_fingerprint(self) -> str:
+        """Hash the goal and every project file's path, mtime and size"""
+        digest = hashlib.blake2b(self.goal.encode(), digest_size=16)
+        stack = [self.project_path]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _FINGERPRINT_SKIP_DIRS:
+                        stack.append(entry.path)
+                        continue
+                    # node_modules is not walked, but its own mtime moves as npm
+                    # adds packages, which can change what tsc reports
+                    if entry.name != "node_modules":
+                        continue
+                elif entry.name in _FINGERPRINT_SKIP_FILES:
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                digest.update(f"\0{entry.path}\0{stat.st_mtime_ns}\0{stat.st_size}".encode())
+        return digest.hexdigest()
+    
+    def _lookup_cached_review(self) -> Tuple[str, Optional[Dict]]:
+        """Fingerprint the project and load the review cached for it, if any"""
+        fingerprint = self._project_fingerprint()
+        cache_path = os.path.join(self.project_path, _REVIEW_CACHE_DIR, f"{fingerprint}.json")
+        try:
+            with open(cache_path, 'rb') as f:
+                return fingerprint, load_json(f.read())
+        except (OSError, ValueError):
+            return fingerprint, None
+    
+    def _store_cached_review(self, fingerprint: str, review: Dict):
+        """Save a review for later lookups; the cache is best effort"""
+        cache_dir = os.path.join(self.project_path, _REVIEW_CACHE_DIR)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            cache_name = f"{fingerprint}.json"
+            with open(os.path.join(cache_dir, cache_name), 'wb') as f:
+                f.write(dump_json(review))
+            # Only the latest review is kept; older fingerprints belong to states the project has left
+            with os.scandir(cache_dir) as entries:
+                for entry in entries:
+                    if entry.name != cache_name:
+                        os.unlink(entry.path)
+        except OSError:
+            pass
+    
+    def _check_project_structure(self, present: FrozenSet[str]) -> Dict:
         """Check if project structure is correct"""
         issues = []
         positives = []
         
-        required_files = [
-            "package.json",
-            "vite.config.ts",
-            "tsconfig.json",
-            "index.html",
-            "src/main.tsx",
-            "src/App.tsx"
-        ]
-        
-        for file in required_files:
-            file_path = os.path.join(self.project_path, file)
-            if not os.path.exists(file_path):
+        for file in _REQUIRED_FILES:
+            if file not in present:
                 issues.append(f"Missing required file: {file}")
             else:
                 positives.append(f"Found: {file}")
         
         # Check for key directories
-        required_dirs = ["src/components", "src/sections", "src/utils"]
-        for dir_path in required_dirs:
-            full_path = os.path.join(self.project_path, dir_path)
-            if os.path.exists(full_path):
+        for dir_path in _REQUIRED_DIRS:
+            if dir_path in present:
                 positives.append(f"Directory exists: {dir_path}")
             else:
                 issues.append(f"Missing directory: {dir_path}")
@@ -82,91 +411,220 @@ class ReviewerAgent:
             "positives": positives
         }
     
-    def _check_code_quality(self) -> Dict:
+    async def _check_code_quality(self, files: Dict[str, _SourceFile]) -> Dict:
         """Check code quality"""
-        issues = []
-        positives = []
+        # The compiler run and the source scan are independent, so overlap them
+        (issues, positives, tsc_cached, tsc_covered), (scan_issues, scan_positives) = await asyncio.gather(
+            self._check_typescript(files),
+            asyncio.to_thread(self._scan_source_quality, files)
+        )
+        issues.extend(scan_issues)
+        positives.extend(scan_positives)
         
-        # Check if TypeScript files compile
+        result = {
+            "status": "pass" if len(issues) < 3 else "needs_improvement",
+            "issues": issues[:_CODE_QUALITY_LIST_LIMIT],  # Limit issues
+            "positives": positives[:_CODE_QUALITY_LIST_LIMIT]
+        }
+        if tsc_cached:
+            result["tsc_cached"] = True
+        if not tsc_covered:
+            result["tsc_unconfirmed"] = True
+        return result
+    
+    async def _check_typescript(self, files: Dict[str, _SourceFile]) -> Tuple[List[str], List[str], bool, bool]:
+        """Check if TypeScript files compile, returning the issues, positives, whether they were reused and whether they cover the sources"""
         try:
-            result = subprocess.run(
-                ["npx", "tsc", "--noEmit"],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            inputs = await asyncio.to_thread(self._typescript_fingerprint, files)
+            fingerprint = inputs.fingerprint
+            if self._last_tsc is not None and self._last_tsc[0] == fingerprint:
+                issues, positives = self._last_tsc[1]
+                return list(issues), list(positives), True, True
             
-            if result.returncode == 0:
+            issues, positives = await self._compile_typescript(inputs)
+        except Exception as e:
+            # A timeout or failure says nothing about the sources, so it is neither reused nor covering
+            return [f"Could not check TypeScript: {str(e)}"], [], False, False
+        
+        # Only a finished compile known to have seen these inputs is stored under their fingerprint
+        self._last_tsc = (fingerprint, (tuple(issues), tuple(positives)))
+        return issues, positives, False, True
+    
+    async def _compile_typescript(self, inputs: _TscInputs) -> Tuple[List[str], List[str]]:
+        """Get a compile that began after inputs were read, raising if none finishes"""
+        issues = []
+        positives = []
+        
+        # Prefer the incremental result of the watching compiler; it only gives
+        # up (returning None) if it cannot run, and then tsc runs once. Either
+        # way the result comes from a compile that began after inputs were read
+        watched = await self._watched_typescript_result(inputs)
+        if watched is not None:
+            if watched.error_count == 0:
                 positives.append("TypeScript compilation successful")
             else:
-                issues.append(f"TypeScript errors: {result.stderr[:200]}")
+                issues.append(f"TypeScript errors: {watched.output[:200]}")
+            return issues, positives
+        
+        proc = await asyncio.create_subprocess_exec(
+            *_TSC_COMMAND,
+            cwd=self.project_path,
+            stdout=asyncio.subprocess.PIPE,
+            # tsc prints its diagnostics on stdout, so report both streams together
+            stderr=asyncio.subprocess.STDOUT,
+            start_new_session=NEW_PROCESS_GROUP
+        )
+        try:
+            output = await asyncio.wait_for(_read_output_head(proc, _TSC_OUTPUT_LIMIT), _TSC_TIMEOUT)
+        except asyncio.TimeoutError:
+            kill_process_group(proc)
+            await reap(proc)
+            raise TimeoutError(f"Command '{list(_TSC_COMMAND)}' timed out after {_TSC_TIMEOUT} seconds")
+        
+        if proc.returncode == 0:
+            positives.append("TypeScript compilation successful")
+        else:
+            issues.append(f"TypeScript errors: {output.decode(errors='replace')[:200]}")
+        return issues, positives
+    
+    async def _watched_typescript_result(self, inputs: _TscInputs) -> Optional[_TscWatchResult]:
+        """Get a `tsc --watch` result that covers inputs"""
+        watcher = self._tsc_watcher
+        if watcher is None or not watcher.is_usable() or watcher.started_ns < inputs.newest_dependency_ns:
+            if watcher is not None:
+                await watcher.close()
+            watcher = self._tsc_watcher = _TscWatcher(self.project_path)
+            try:
+                await watcher.start()
+            except OSError:
+                self._tsc_watcher = None
+                return None
         
-        except Exception as e:
-            issues.append(f"Could not check TypeScript: {str(e)}")
+        try:
+            return await watcher.result_for(inputs, _TSC_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"tsc --watch reported no result within {_TSC_TIMEOUT} seconds")
+    
+    async def close(self):
+        """Stop the background TypeScript compiler, if one was started"""
+        if self._tsc_watcher is not None:
+            await self._tsc_watcher.close()
+            self._tsc_watcher = None
+    
+    def _typescript_fingerprint(self, files: Dict[str, _SourceFile]) -> _TscInputs:
+        """Hash tsc's inputs (sources, config, installed packages) and collect what tells a watched compile is current"""
+        digest = hashlib.blake2b(digest_size=16)
+        sources = []
+        newest_ns = 0
+        for relative_path, source in files.items():
+            if relative_path.endswith(_TYPESCRIPT_EXTENSIONS):
+                digest.update(f"\0{relative_path}\0{len(source.content)}\0".encode())
+                digest.update(source.content.encode())
+                sources.append(relative_path)
+                newest_ns = max(newest_ns, source.mtime_ns)
+        # node_modules' mtime moves as npm install adds packages, so a run that
+        # failed on missing dependencies is not reused once they arrive
+        newest_dependency_ns = 0
+        for name in ("src", "tsconfig.json", "package.json", "node_modules"):
+            try:
+                stat = os.stat(os.path.join(self.project_path, name))
+            except OSError:
+                digest.update(f"\0{name}\0-".encode())
+                continue
+            digest.update(f"\0{name}\0{stat.st_mtime_ns}\0{stat.st_size}".encode())
+            # tsc --watch notices new or deleted sources and config edits, but not
+            # every package install, so those are tracked apart
+            if name in ("package.json", "node_modules"):
+                newest_dependency_ns = max(newest_dependency_ns, stat.st_mtime_ns)
+            elif name == "tsconfig.json":
+                newest_ns = max(newest_ns, stat.st_mtime_ns)
+        return _TscInputs(
+            digest.hexdigest(),
+            frozenset(sources),
+            newest_ns,
+            self._newest_directory_mtime(os.path.join(self.project_path, "src")),
+            newest_dependency_ns
+        )
+    
+    def _newest_directory_mtime(self, root: str) -> int:
+        """Newest mtime of root and every directory below it"""
+        newest_ns = 0
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                newest_ns = max(newest_ns, os.stat(directory).st_mtime_ns)
+                with os.scandir(directory) as entries:
+                    stack.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+            except OSError:
+                continue
+        return newest_ns
+    
+    def _scan_source_quality(self, files: Dict[str, _SourceFile]) -> Tuple[List[str], List[str]]:
+        """Check source files for common code quality issues"""
+        issues = []
+        positives = []
+        # Everything past the report limit would be cut off, so stop collecting there;
+        # a full issue list still fails the check, as the untruncated one did
+        limit = _CODE_QUALITY_LIST_LIMIT
         
         # Check for common code quality issues
-        src_path = os.path.join(self.project_path, "src")
-        if os.path.exists(src_path):
-            for root, dirs, files in os.walk(src_path):
-                for file in files:
-                    if file.endswith(('.ts', '.tsx')):
-                        file_path = os.path.join(root, file)
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                
-                                # Check for basic quality indicators
-                                if 'export' in content:
-                                    positives.append(f"{file} has exports")
-                                if 'function' in content or 'const' in content:
-                                    positives.append(f"{file} has functions/components")
-                                if 'any' in content and 'any' not in ['anywhere', 'company']:
-                                    issues.append(f"{file} uses 'any' type (consider using proper types)")
-                        except Exception as e:
-                            issues.append(f"Could not read {file}: {str(e)}")
-        
-        return {
-            "status": "pass" if len(issues) < 3 else "needs_improvement",
-            "issues": issues[:10],  # Limit issues
-            "positives": positives[:10]
-        }
+        for relative_path, source in files.items():
+            if len(issues) >= limit and len(positives) >= limit:
+                break
+            if not (relative_path.startswith("src/") and relative_path.endswith(_TYPESCRIPT_EXTENSIONS)):
+                continue
+            file = source.name
+            if source.error is not None:
+                if len(issues) < limit:
+                    issues.append(f"Could not read {file}: {str(source.error)}")
+                continue
+            
+            # Check for basic quality indicators
+            content = source.content
+            if len(positives) < limit:
+                if 'export' in content:
+                    positives.append(f"{file} has exports")
+                if 'function' in content or 'const' in content:
+                    positives.append(f"{file} has functions/components")
+            if len(issues) < limit and _ANY_TYPE_RE.search(content):
+                issues.append(f"{file} uses 'any' type (consider using proper types)")
+        
+        return issues, positives
     
-    def _check_functionality(self) -> Dict:
+    def _check_functionality(self, files: Dict[str, _SourceFile]) -> Dict:
         """Check if basic functionality exists"""
         issues = []
         positives = []
         
         # Check if package.json has scripts
-        package_json_path = os.path.join(self.project_path, "package.json")
-        if os.path.exists(package_json_path):
+        package_source = files.get("package.json")
+        if package_source is not None:
             try:
-                with open(package_json_path, 'r') as f:
-                    package_json = json.load(f)
-                    scripts = package_json.get("scripts", {})
-                    
-                    if "dev" in scripts:
-                        positives.append("Dev script configured")
-                    if "build" in scripts:
-                        positives.append("Build script configured")
-                    if not scripts:
-                        issues.append("No scripts in package.json")
+                if package_source.error is not None:
+                    raise package_source.error
+                package_json = json.loads(package_source.content)
+                scripts = package_json.get("scripts", {})
+                
+                if "dev" in scripts:
+                    positives.append("Dev script configured")
+                if "build" in scripts:
+                    positives.append("Build script configured")
+                if not scripts:
+                    issues.append("No scripts in package.json")
             except Exception as e:
                 issues.append(f"Could not read package.json: {str(e)}")
         
         # Check if main components exist
-        app_path = os.path.join(self.project_path, "src", "App.tsx")
-        if os.path.exists(app_path):
+        app_source = files.get("src/App.tsx")
+        if app_source is not None:
             positives.append("App.tsx exists")
-            try:
-                with open(app_path, 'r') as f:
-                    content = f.read()
-                    if 'return' in content and ('<' in content or 'JSX' in content):
-                        positives.append("App.tsx has JSX content")
-                    else:
-                        issues.append("App.tsx appears empty or incomplete")
-            except Exception as e:
-                issues.append(f"Could not read App.tsx: {str(e)}")
+            if app_source.error is not None:
+                issues.append(f"Could not read App.tsx: {str(app_source.error)}")
+            elif 'return' in app_source.content and ('<' in app_source.content or 'JSX' in app_source.content):
+                positives.append("App.tsx has JSX content")
+            else:
+                issues.append("App.tsx appears empty or incomplete")
         else:
             issues.append("App.tsx missing")
         
@@ -176,45 +634,41 @@ class ReviewerAgent:
             "positives": positives
         }
     
-    def _check_goal_alignment(self) -> Dict:
+    def _check_goal_alignment(self, files: Dict[str, _SourceFile]) -> Dict:
         """Check if project aligns with the goal"""
         issues = []
         positives = []
         goal_lower = self.goal.lower()
         
-        # Analyze goal keywords
-        goal_keywords = {
-            "e-commerce": ["cart", "checkout", "payment", "product", "shop"],
-            "dashboard": ["dashboard", "chart", "analytics", "metrics"],
-            "authentication": ["login", "auth", "signup", "user"],
-            "api": ["api", "fetch", "axios", "service"],
-            "database": ["database", "db", "postgres", "mongo"],
-            "responsive": ["responsive", "mobile", "tailwind", "css"]
-        }
+        goal_types = [
+            (keyword_type, keywords)
+            for keyword_type, keywords in _GOAL_KEYWORDS.items()
+            if keyword_type in goal_lower
+        ]
         
-        # Check project files for goal-related content
-        src_path = os.path.join(self.project_path, "src")
-        project_content = ""
-        
-        if os.path.exists(src_path):
-            for root, dirs, files in os.walk(src_path):
-                for file in files:
-                    if file.endswith(('.ts', '.tsx', '.js', '.jsx')):
-                        file_path = os.path.join(root, file)
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                project_content += f.read().lower()
-                        except:
-                            pass
+        # Check project files for goal-related content, file by file, until
+        # every keyword the goal asks about has been seen
+        wanted = {keyword for _, keywords in goal_types for keyword in keywords}
+        present = set()
+        for relative_path, source in files.items():
+            if not wanted:
+                break
+            if not relative_path.startswith("src/") or source.error is not None:
+                continue
+            # Find every keyword in one scan when the automaton is available
+            if _KEYWORD_AUTOMATON is not None:
+                present.update(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(source.lowered))
+            else:
+                present.update(keyword for keyword in wanted if keyword in source.lowered)
+            wanted -= present
         
         # Check for goal-related keywords
-        for keyword_type, keywords in goal_keywords.items():
-            if keyword_type in goal_lower:
-                found_keywords = [kw for kw in keywords if kw in project_content]
-                if found_keywords:
-                    positives.append(f"Found {keyword_type} related code: {', '.join(found_keywords[:3])}")
-                else:
-                    issues.append(f"Goal mentions {keyword_type} but no related code found")
+        for keyword_type, keywords in goal_types:
+            found_keywords = [kw for kw in keywords if kw in present]
+            if found_keywords:
+                positives.append(f"Found {keyword_type} related code: {', '.join(found_keywords[:3])}")
+            else:
+                issues.append(f"Goal mentions {keyword_type} but no related code found")
         
         # General goal alignment
         if len(positives) > len(issues):
@@ -228,39 +682,36 @@ class ReviewerAgent:
             "positives": positives
         }
     
-    def _check_best_practices(self) -> Dict:
+    def _check_best_practices(self, present: FrozenSet[str], files: Dict[str, _SourceFile]) -> Dict:
         """Check for best practices"""
         issues = []
         positives = []
         
         # Check for environment variables usage
-        env_example_path = os.path.join(self.project_path, ".env.example")
-        if os.path.exists(env_example_path):
+        if ".env.example" in present:
             positives.append(".env.example file exists (good practice)")
         else:
             issues.append("Consider adding .env.example for configuration")
         
         # Check for README
-        readme_path = os.path.join(self.project_path, "README.md")
-        if os.path.exists(readme_path):
+        if "README.md" in present:
             positives.append("README.md exists")
         else:
             issues.append("Consider adding README.md")
         
         # Check for .gitignore
-        gitignore_path = os.path.join(self.project_path, ".gitignore")
-        if os.path.exists(gitignore_path):
+        if ".gitignore" in present:
             positives.append(".gitignore exists")
         else:
             issues.append("Consider adding .gitignore")
         
         # Check for proper TypeScript usage
-        src_path = os.path.join(self.project_path, "src")
-        if os.path.exists(src_path):
-            ts_files = list(Path(src_path).rglob("*.ts"))
-            tsx_files = list(Path(src_path).rglob("*.tsx"))
-            if len(ts_files) + len(tsx_files) > 0:
-                positives.append(f"Using TypeScript ({len(ts_files) + len(tsx_files)} files)")
+        ts_file_count = sum(
+            1 for relative_path in files
+            if relative_path.startswith("src/") and relative_path.endswith(_TYPESCRIPT_EXTENSIONS)
+        )
+        if ts_file_count > 0:
+            positives.append(f"Using TypeScript ({ts_file_count} files)")
         
         return {
             "status": "pass" if len(issues) < 3 else "needs_improvement",
@@ -268,10 +719,81 @@ class ReviewerAgent:
             "positives": positives
         }
     
-    def _calculate_score(self, checks: Dict) -> float:
+    def _iter_src(self, exts: Tuple[str, ...]) -> Iterator[os.DirEntry]:
+        """Yield files under src/ ending in one of exts, in the same order os.walk would visit them"""
+        stack = [os.path.join(self.project_path, "src")]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.endswith(exts):
+                            yield entry
+            except OSError:
+                continue  # Missing or unreadable directory, skipped like os.walk does
+            stack.extend(reversed(subdirs))
+    
+    def _snapshot_project(self) -> Tuple[FrozenSet[str], Dict[str, _SourceFile]]:
+        """List the top-level and src/ entries, and read every source file under src/ plus package.json"""
+        present = set()
+        entries = list(self._iter_src(_SOURCE_EXTENSIONS))
+        if len(entries) >= _PARALLEL_READ_MIN_FILES:
+            sources = _READ_POOL.map(self._snapshot_file, entries)
+        else:
+            sources = map(self._snapshot_file, entries)
+        files = {
+            os.path.relpath(entry.path, self.project_path).replace(os.sep, "/"): source
+            for entry, source in zip(entries, sources)
+        }
+        
+        # Two directory listings stand in for one exists() call per required path
+        for directory, prefix in ((self.project_path, ""), (os.path.join(self.project_path, "src"), "src/")):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        present.add(prefix + entry.name)
+                        if entry.name == "package.json" and not prefix:
+                            files["package.json"] = self._snapshot_file(entry)
+            except OSError:
+                pass
+        return frozenset(present), files
+    
+    def _snapshot_file(self, entry: os.DirEntry) -> _SourceFile:
+        """Read one file for the snapshot, keeping the error instead of raising it"""
+        try:
+            content, lowered = self._read_source(entry)
+        except Exception as e:
+            return _SourceFile(entry.name, "", "", error=e)
+        return _SourceFile(entry.name, content, lowered, entry.stat().st_mtime_ns)
+    
+    def _read_source(self, entry: os.DirEntry) -> Tuple[str, str]:
+        """Read a source file and its lowercased form, reusing the cached copy while mtime and size match"""
+        file_path = entry.path
+        stat = entry.stat()
+        cached = self._content_cache.get(file_path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2], cached[3]
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        cached = (stat.st_mtime_ns, stat.st_size, content, content.lower())
+        self._content_cache[file_path] = cached
+        return cached[2], cached[3]
+    
+    def _passed_mask(self, checks: Dict) -> int:
+        """Fold the checks whose status is "pass" into a bitmask of _CHECK_BITS"""
+        passed = 0
+        for check_name, check_result in checks.items():
+            if check_result.get("status") == "pass":
+                passed |= _CHECK_BITS[check_name]
+        return passed
+    
+    def _calculate_score(self, checks: Dict, passed: int) -> float:
         """Calculate overall score (0-100)"""
         total_checks = len(checks)
-        passed_checks = sum(1 for check in checks.values() if check.get("status") == "pass")
+        passed_checks = passed.bit_count()
         
         base_score = (passed_checks / total_checks) * 100
         
@@ -286,12 +808,12 @@ class ReviewerAgent:
         final_score = base_score - issue_penalty + positive_bonus
         return max(0, min(100, final_score))
     
-    def _generate_feedback(self, checks: Dict) -> List[str]:
+    def _generate_feedback(self, checks: Dict, passed: int) -> List[str]:
         """Generate actionable feedback"""
         feedback = []
         
         for check_name, check_result in checks.items():
-            if check_result.get("status") != "pass":
+            if not passed & _CHECK_BITS[check_name]:
                 issues = check_result.get("issues", [])
                 if issues:
                     feedback.append(f"{check_name.replace('_', ' ').title()}: {issues[0]}")
@@ -304,35 +826,22 @@ class ReviewerAgent:
         if all_positives:
             feedback.append(f"Good progress: {', '.join(all_positives[:3])}")
         
-        # Goal-specific feedback
-        if not self._evaluate_goal({"checks": checks}):
+        # Goal-specific feedback; the score is not known yet at this point
+        if not self._evaluate_goal(0, passed):
             feedback.append(f"Continue working towards goal: {self.goal}")
         
         return feedback
     
-    def _evaluate_goal(self, review: Dict) -> bool:
+    def _evaluate_goal(self, score: float, passed: int) -> bool:
         """Evaluate if the goal has been met"""
-        score = review.get("score", 0)
-        checks = review.get("checks", {})
-        
         # Goal is met if:
         # 1. Score is above 85
         # 2. All critical checks pass
         # 3. Goal alignment is good
-        
-        critical_checks = ["structure", "functionality"]
-        critical_passed = all(
-            checks.get(check, {}).get("status") == "pass"
-            for check in critical_checks
-        )
-        
-        goal_aligned = checks.get("goal_alignment", {}).get("status") == "pass"
-        
-        return score >= 85 and critical_passed and goal_aligned
+        return score >= 85 and passed & _GOAL_REQUIRED_MASK == _GOAL_REQUIRED_MASK
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def get_improvement_suggestions(self) -> List[str]:
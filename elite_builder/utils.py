@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Utilities - Helpers shared by the agents
+"""
+
+import os
+import json
+import signal
+import asyncio
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# npm and npx run the real tool as a grandchild that holds our pipes, so child processes
+# get their own process group and are killed as a group; POSIX only, elsewhere the
+# direct child is killed
+NEW_PROCESS_GROUP = hasattr(os, "killpg")
+# How long to wait for a killed process to be reaped before giving up on it
+_KILL_WAIT_TIMEOUT = 5  # seconds
+
+def kill_process_group(proc: asyncio.subprocess.Process):
+    """Kill a process started with start_new_session, along with everything it spawned"""
+    try:
+        if NEW_PROCESS_GROUP:
+            os.killpg(proc.pid, signal.SIGKILL)
+        elif proc.returncode is None:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+def dump_json(data: Any) -> bytes:
+    """Serialize to compact JSON, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+def dump_json_line(data: Any) -> bytes:
+    """Serialize to compact JSON ending in a newline, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, separators=(',', ':')).encode() + b"\n"
+
+def dump_json_indented(data: Any) -> bytes:
+    """Serialize to 2-space indented JSON, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+def load_json(raw: bytes) -> Any:
+    """Parse JSON, using orjson when installed (orjson.JSONDecodeError subclasses json's)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+async def reap(proc: asyncio.subprocess.Process):
+    """Wait a bounded time for a killed process, since a survivor holding its pipes would stall wait()"""
+    try:
+        await asyncio.wait_for(proc.wait(), _KILL_WAIT_TIMEOUT)
+    except asyncio.TimeoutError:
+        pass